@@ -4,40 +4,53 @@ Phase 1: Core Functionality - PIN auth, one-page scraping, reader, storage.
 """
 import os
 import gzip
+import hashlib
+import logging
+import asyncio
+import anyio
+import io
 import uuid
-import tempfile
 import shutil
 import json
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+import orjson
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
-from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
 from backend.auth import init_auth, get_auth_manager, require_auth
+from backend.cache import TTLCache
 from backend.storage.manager import StorageManager
+from backend.storage.batcher import ChapterWriteBatcher
 from backend.scraper.extractor import ContentExtractor
-from backend.scraper.modes import ScrapeMode
+from backend.scraper.modes import ScrapeMode, MULTI_PAGE_MODES
 from backend.importer import FileParser, FolderValidator
 from backend.models.schemas import (
     AuthRequest,
     AuthResponse,
     TokenVerifyRequest,
     ScrapeRequest,
+    ScrapeModeName,
     ScrapeResponse,
     CreateBookRequest,
     CreateBookResponse,
     AddChapterRequest,
     AddChapterResponse,
+    ChapterSpec,
+    AddChaptersRequest,
+    AddChaptersResponse,
     PreviewRequest,
     PreviewResponse,
     PreviewMetadata,
-    ContentSizeInfo,
-    ContainerInfo,
     ChapterLink,
-    IndexPagePreview,
     BookListResponse,
     BookDetailResponse,
     ChapterContent,
@@ -51,11 +64,16 @@ from backend.models.schemas import (
 # Load environment variables
 load_dotenv()
 
+# Configure logging (debug output from the scraper endpoints is off by default)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Book Scraper & Reader API",
     description="API for scraping books from web pages and reading them",
-    version="1.0.0 (Phase 1)"
+    version="1.0.0 (Phase 1)",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -64,44 +82,533 @@ CORS_ORIGINS_ENV = os.getenv("CORS_ORIGINS", "http://localhost:3000")
 if CORS_ORIGINS_ENV == "*":
     CORS_ORIGINS = ["*"]
 else:
-    CORS_ORIGINS = CORS_ORIGINS_ENV.split(",")
+    # Strip padding so "http://a, http://b" still matches "http://b"
+    CORS_ORIGINS = [origin.strip() for origin in CORS_ORIGINS_ENV.split(",") if origin.strip()]
+
+# Checked for every cross-origin request, so use a set for O(1) membership
+CORS_ORIGINS_SET = frozenset(CORS_ORIGINS)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
+    allow_origins=CORS_ORIGINS_SET,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger responses (chapter markdown shrinks several times over)
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "5"))
+
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL
+)
+
 # Initialize authentication
 APP_PIN = os.getenv("APP_PIN", "1234")
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
+JWT_CACHE_TTL_SECONDS = float(os.getenv("JWT_CACHE_TTL_SECONDS", "5"))
+# A pre-generated bcrypt hash of the PIN lets workers start without hashing it
+APP_PIN_HASH = os.getenv("APP_PIN_HASH", "")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
 init_auth(
     pin=APP_PIN,
     secret_key=JWT_SECRET_KEY,
     algorithm=JWT_ALGORITHM,
-    expiration_hours=JWT_EXPIRATION_HOURS
+    expiration_hours=JWT_EXPIRATION_HOURS,
+    cache_ttl_seconds=JWT_CACHE_TTL_SECONDS,
+    pin_hash=APP_PIN_HASH.encode("utf-8") if APP_PIN_HASH else None,
+    bcrypt_rounds=BCRYPT_ROUNDS
 )
 
 # Initialize storage manager
 DATA_DIR = os.getenv("DATA_DIR", "./data/books")
 storage = StorageManager(data_dir=DATA_DIR)
 
+# Coalesce concurrent add-chapter writes into one storage transaction per book
+ADD_CHAPTER_BATCH_WINDOW_MS = int(os.getenv("ADD_CHAPTER_BATCH_WINDOW_MS", "50"))
+chapter_batcher = ChapterWriteBatcher(
+    storage,
+    window_seconds=ADD_CHAPTER_BATCH_WINDOW_MS / 1000
+)
+
 # Initialize content extractor
 MAX_CONTENT_SIZE_MB = int(os.getenv("MAX_CONTENT_SIZE_MB", "50"))
 REQUEST_TIMEOUT_SECONDS = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+
+# Recently fetched pages are reused so preview followed by execute fetches once
+PAGE_CACHE_TTL_SECONDS = int(os.getenv("PAGE_CACHE_TTL_SECONDS", "60"))
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "256"))
+page_cache = TTLCache(
+    maxsize=PAGE_CACHE_MAX_ENTRIES,
+    ttl_seconds=PAGE_CACHE_TTL_SECONDS
+)
+
+# Pages served with an ETag or Last-Modified are kept longer and revalidated
+# with a conditional request, so unchanged pages skip the download. Only pages
+# up to PAGE_VALIDATOR_MAX_PAGE_KB are kept, bounding the cache's memory use.
+PAGE_VALIDATOR_TTL_SECONDS = int(os.getenv("PAGE_VALIDATOR_TTL_SECONDS", "3600"))
+PAGE_VALIDATOR_MAX_ENTRIES = int(os.getenv("PAGE_VALIDATOR_MAX_ENTRIES", "128"))
+PAGE_VALIDATOR_MAX_PAGE_KB = int(os.getenv("PAGE_VALIDATOR_MAX_PAGE_KB", "1024"))
+page_validator_cache = TTLCache(
+    maxsize=PAGE_VALIDATOR_MAX_ENTRIES,
+    ttl_seconds=PAGE_VALIDATOR_TTL_SECONDS
+)
+
 extractor = ContentExtractor(
     timeout=REQUEST_TIMEOUT_SECONDS,
-    max_size_mb=MAX_CONTENT_SIZE_MB
+    max_size_mb=MAX_CONTENT_SIZE_MB,
+    max_connections=HTTP_MAX_CONNECTIONS,
+    page_cache=page_cache,
+    validator_cache=page_validator_cache,
+    validator_max_page_kb=PAGE_VALIDATOR_MAX_PAGE_KB
+)
+
+# Full preview content kept for streaming via /api/scraper/preview/{token}/content
+PREVIEW_CACHE_TTL_SECONDS = int(os.getenv("PREVIEW_CACHE_TTL_SECONDS", "300"))
+PREVIEW_CACHE_MAX_ENTRIES = int(os.getenv("PREVIEW_CACHE_MAX_ENTRIES", "32"))
+PREVIEW_STREAM_CHUNK_BYTES = 64 * 1024
+preview_content_cache = TTLCache(
+    maxsize=PREVIEW_CACHE_MAX_ENTRIES,
+    ttl_seconds=PREVIEW_CACHE_TTL_SECONDS
 )
 
+# Serialized chapter responses, so repeated reads skip the disk and the encoder
+CHAPTER_CACHE_TTL_SECONDS = int(os.getenv("CHAPTER_CACHE_TTL_SECONDS", "3600"))
+CHAPTER_CACHE_MAX_ENTRIES = int(os.getenv("CHAPTER_CACHE_MAX_ENTRIES", "128"))
+chapter_response_cache = TTLCache(
+    maxsize=CHAPTER_CACHE_MAX_ENTRIES,
+    ttl_seconds=CHAPTER_CACHE_TTL_SECONDS
+)
+
+# Number of chapters scraped in parallel for INDEX_PAGE/HYBRID execution
+CONCURRENT_CHAPTERS = int(os.getenv("CONCURRENT_CHAPTERS", "8"))
+
+
+# Worker threads available for blocking scraper/storage calls
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+# Worker processes for parsing uploaded files, so concurrent imports are not
+# serialized by the GIL (0 parses in the threadpool instead)
+IMPORT_PROCESS_WORKERS = int(os.getenv("IMPORT_PROCESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+import_pool: Optional[ProcessPoolExecutor] = None
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Size the threadpool used to offload blocking calls from the event loop."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+async def start_import_pool():
+    """Start the import worker processes before any request threads exist."""
+    global import_pool
+    if IMPORT_PROCESS_WORKERS <= 0:
+        return
+
+    import_pool = ProcessPoolExecutor(max_workers=IMPORT_PROCESS_WORKERS)
+    # The first task launches every worker; do it now rather than mid-request
+    await asyncio.get_running_loop().run_in_executor(import_pool, os.getpid)
+
+
+@app.on_event("startup")
+async def build_openapi_schema():
+    """Generate the OpenAPI schema once at boot instead of on the first /docs hit."""
+    app.openapi()
+
+
+@app.on_event("shutdown")
+async def stop_import_pool():
+    """Stop the import worker processes."""
+    global import_pool
+    if import_pool is not None:
+        import_pool.shutdown(wait=False, cancel_futures=True)
+        import_pool = None
+
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Release pooled upstream connections held by the extractor."""
+    extractor.close()
+
 
 # ==================== Utility Functions ====================
 
+# Only this much of the content is actually compressed for size estimates
+COMPRESSION_SAMPLE_BYTES = 64 * 1024
+
+
+def estimate_compressed_size(content_bytes: bytes) -> int:
+    """
+    Estimate the gzip-compressed size of content.
+
+    Compresses only a leading sample at the fastest level and extrapolates
+    the ratio, so large pages don't stall the event loop.
+
+    Args:
+        content_bytes: UTF-8 encoded content
+
+    Returns:
+        Estimated compressed size in bytes
+    """
+    if not content_bytes:
+        return 0
+
+    sample = content_bytes[:COMPRESSION_SAMPLE_BYTES]
+    compressed_sample_size = len(gzip.compress(sample, compresslevel=1))
+
+    if len(sample) == len(content_bytes):
+        return compressed_sample_size
+
+    ratio = compressed_sample_size / len(sample)
+    return int(len(content_bytes) * ratio)
+
+
+def _cache_preview_content(content_utf8: bytes) -> str:
+    """
+    Keep a preview's full content so it can be streamed separately.
+
+    Args:
+        content_utf8: Full content encoded as UTF-8
+
+    Returns:
+        Token for /api/scraper/preview/{token}/content
+    """
+    content_token = uuid.uuid4().hex
+    preview_content_cache.put(content_token, content_utf8)
+    return content_token
+
+
+def _index_preview_response(
+    mode: ScrapeMode,
+    chapter_links: list,
+    metadata: dict,
+    index_content: Optional[str],
+    index_length: int
+) -> ORJSONResponse:
+    """
+    Build a successful INDEX_PAGE / HYBRID preview response.
+
+    Index pages can list thousands of chapters, so the payload is encoded
+    directly instead of round-tripping through PreviewResponse validation.
+
+    Args:
+        mode: Scraping mode of the request
+        chapter_links: Chapter links found on the index page
+        metadata: Metadata dict from the extractor
+        index_content: Truncated index page content (HYBRID only)
+        index_length: Full length of the index page content
+
+    Returns:
+        ORJSONResponse matching the PreviewResponse schema
+    """
+    return ORJSONResponse({
+        "success": True,
+        "mode": mode,
+        "content_preview": "",  # Not used for INDEX/HYBRID
+        "full_length": 0,
+        "full_content": None,
+        "content_token": None,
+        "metadata": {
+            "title": metadata.get('title'),
+            "author": metadata.get('author'),
+            "language": metadata.get('language', 'en'),
+            "description": metadata.get('description'),
+            "tags": metadata.get('tags', [])
+        },
+        "size_info": None,
+        "containers": None,
+        "index_preview": {
+            "chapters": chapter_links,
+            "total_chapters_found": len(chapter_links),
+            "index_content": index_content,
+            "index_content_length": index_length
+        },
+        "editable_fields": ["title", "author", "language", "description", "tags"],
+        "error": None
+    })
+
+
+async def _iter_content_chunks(content_utf8: bytes):
+    """Yield content in fixed-size chunks so the response body is never built at once."""
+    for start in range(0, len(content_utf8), PREVIEW_STREAM_CHUNK_BYTES):
+        yield content_utf8[start:start + PREVIEW_STREAM_CHUNK_BYTES]
+
+
+# Shared by every preview error response (never mutated)
+_EMPTY_METADATA = PreviewMetadata.model_construct()
+
+
+def _preview_error(mode: ScrapeMode, error: str) -> PreviewResponse:
+    """
+    Build a failed preview response.
+
+    Args:
+        mode: Scraping mode of the request
+        error: Error message
+
+    Returns:
+        PreviewResponse with success=False and empty content
+    """
+    return PreviewResponse.model_construct(
+        success=False,
+        mode=mode,
+        content_preview="",
+        full_length=0,
+        metadata=_EMPTY_METADATA,
+        error=error
+    )
+
+
+def _one_page_preview_response(
+    mode: ScrapeMode,
+    content: str,
+    metadata: dict,
+    containers: Optional[list],
+    include_full_content: bool
+) -> ORJSONResponse:
+    """
+    Build a successful ONE_PAGE preview response.
+
+    The body is assembled as plain dicts in PreviewResponse's shape and
+    serialized directly, skipping model construction on the hot path.
+
+    Args:
+        mode: Scraping mode of the request
+        content: Extracted content
+        metadata: Metadata dict from the extractor
+        containers: Tracked containers from the extractor (or None)
+        include_full_content: Whether to inline the full content
+
+    Returns:
+        ORJSONResponse matching PreviewResponse
+    """
+    # Content length in characters and UTF-8 bytes (computed once)
+    content_len = len(content)
+    content_utf8 = content.encode('utf-8')
+    content_bytes = len(content_utf8)
+
+    # Create preview (first 500 characters)
+    content_preview = content[:500]
+    if content_len > 500:
+        content_preview += "..."
+
+    containers_list = None
+    if containers:
+        containers_list = [
+            {
+                "type": c['type'],
+                "id": c.get('id'),
+                "classes": c.get('classes'),
+                "content_length": c['content_length'],
+                "content_preview": c['content_preview'],
+                "selected": True  # Default to selected
+            }
+            for c in containers
+        ]
+
+    return ORJSONResponse({
+        "success": True,
+        "mode": mode,
+        "content_preview": content_preview,
+        "full_length": content_len,
+        "full_content": content if include_full_content else None,
+        "content_token": _cache_preview_content(content_utf8),
+        "metadata": {
+            "title": metadata.get('title'),
+            "author": metadata.get('author'),
+            "language": metadata.get('language', 'en'),
+            "description": metadata.get('description'),
+            "tags": metadata.get('tags', [])
+        },
+        "size_info": {
+            "character_count": content_len,
+            "estimated_bytes": content_bytes,
+            "formatted_size": format_bytes(content_bytes),
+            "compression_estimate": format_bytes(estimate_compressed_size(content_utf8))
+        },
+        "containers": containers_list,
+        "index_preview": None,
+        "editable_fields": ["title", "author", "language", "description", "tags"],
+        "error": None
+    })
+
+
+# Book and chapter responses may change when chapters are re-scraped, so clients
+# revalidate every time and get a 304 while their copy is current
+BOOK_CACHE_CONTROL = "private, no-cache"
+
+
+def _json_body_with_etag(payload: BaseModel) -> Tuple[bytes, str]:
+    """
+    Serialize a response model and derive its ETag from the body.
+
+    Args:
+        payload: Response model to send
+
+    Returns:
+        Tuple of (JSON body, quoted ETag)
+    """
+    body = orjson.dumps(payload.model_dump(mode="json"))
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return body, etag
+
+
+def _conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Send a serialized JSON body with its ETag, honouring If-None-Match.
+
+    Args:
+        request: Incoming request
+        body: JSON body (see _json_body_with_etag)
+        etag: Quoted ETag of the body
+
+    Returns:
+        304 response if the client's copy is current, otherwise the JSON body
+    """
+    headers = {"ETag": etag, "Cache-Control": BOOK_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _load_chapter_content(spec) -> Tuple[Optional[str], Optional[AddChapterResponse]]:
+    """
+    Get the content for a chapter to be added to a book.
+    Uses custom content when provided, otherwise scrapes the chapter URL.
+
+    Args:
+        spec: AddChapterRequest or ChapterSpec
+
+    Returns:
+        Tuple of (chapter_content, error_response)
+    """
+    # Use custom content instead of scraping
+    if spec.custom_content:
+        return spec.custom_content, None
+
+    if spec.selected_containers is not None:
+        # Use selected containers
+        html, error = await run_in_threadpool(extractor.fetch_page, spec.chapter_url)
+        if error:
+            return None, AddChapterResponse(
+                success=False,
+                error=error,
+                message=f"Failed to fetch chapter: {error}"
+            )
+
+        # Extract content and get containers
+        chapter_content, containers = await run_in_threadpool(
+            extractor.extract_content,
+            html,
+            track_containers=True,
+            chinese_mode=spec.chinese_mode,
+            simplify_markdown=spec.simplify_markdown
+        )
+
+        # Re-extract with only selected containers
+        if containers:
+            chapter_content = await run_in_threadpool(
+                extractor.extract_content_from_selected_containers,
+                html, containers, spec.selected_containers
+            )
+
+        return chapter_content, None
+
+    # Normal scraping
+    result, error = await run_in_threadpool(
+        extractor.scrape_page,
+        spec.chapter_url,
+        chinese_mode=spec.chinese_mode,
+        simplify_markdown=spec.simplify_markdown
+    )
+    if error:
+        return None, AddChapterResponse(
+            success=False,
+            error=error,
+            message=f"Failed to scrape chapter: {error}"
+        )
+
+    return result['content'], None
+
+
+async def _scrape_chapter(
+    semaphore: asyncio.Semaphore,
+    idx: int,
+    total: int,
+    chapter_url: str,
+    chinese_mode: bool = False,
+    simplify_markdown: bool = False
+):
+    """
+    Scrape one chapter in the threadpool, bounded by a shared semaphore.
+
+    Args:
+        semaphore: Limits how many chapters are fetched at once
+        idx: Chapter position (0-indexed), used for progress output
+        total: Total number of chapters being scraped
+        chapter_url: Chapter URL
+        chinese_mode: Use Chinese character detection for content extraction
+        simplify_markdown: Simplify markdown to only headings, paragraphs, and lists
+
+    Returns:
+        Tuple of (result_dict, error_message) from ContentExtractor.scrape_page
+    """
+    async with semaphore:
+        logger.debug("Scraping chapter %d/%d: %s", idx + 1, total, chapter_url)
+
+        return await run_in_threadpool(
+            extractor.scrape_page,
+            chapter_url,
+            chinese_mode=chinese_mode,
+            simplify_markdown=simplify_markdown
+        )
+
+
+# Size units for format_bytes: (divisor, format) indexed by power of 1024
+_SIZE_UNITS = (
+    (1, "{:.0f} B"),
+    (1024, "{:.1f} KB"),
+    (1024 ** 2, "{:.2f} MB"),
+    (1024 ** 3, "{:.2f} GB"),
+)
+
+
+async def _parse_import_file(file_content: bytes, filename: str, file_ext: str) -> dict:
+    """
+    Parse an uploaded file off the event loop.
+
+    Uses the import process pool when it is running, otherwise the threadpool.
+
+    Args:
+        file_content: Raw file bytes
+        filename: Original filename
+        file_ext: File extension (.txt or .md)
+
+    Returns:
+        Parsed file dict (see FileParser.parse_file)
+    """
+    if import_pool is None:
+        return await run_in_threadpool(FileParser.parse_file, file_content, filename, file_ext)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        import_pool, FileParser.parse_file, file_content, filename, file_ext
+    )
+
+
 def format_bytes(bytes_count: int) -> str:
     """
     Format bytes into human-readable size.
@@ -114,12 +621,11 @@ def format_bytes(bytes_count: int) -> str:
     """
     if bytes_count < 1024:
         return f"{bytes_count} B"
-    elif bytes_count < 1024 * 1024:
-        return f"{bytes_count / 1024:.1f} KB"
-    elif bytes_count < 1024 * 1024 * 1024:
-        return f"{bytes_count / (1024 * 1024):.2f} MB"
-    else:
-        return f"{bytes_count / (1024 * 1024 * 1024):.2f} GB"
+
+    # Each unit spans 10 bits, so the bit length selects the unit directly
+    unit = min((bytes_count.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    divisor, fmt = _SIZE_UNITS[unit]
+    return fmt.format(bytes_count / divisor)
 
 
 # ==================== API Endpoints ====================
@@ -163,7 +669,8 @@ async def login(auth_request: AuthRequest):
         JWT token and expiration time
     """
     auth_manager = get_auth_manager()
-    token = auth_manager.authenticate(auth_request.pin)
+    # bcrypt is deliberately slow; keep it off the event loop
+    token = await run_in_threadpool(auth_manager.authenticate, auth_request.pin)
 
     if not token:
         raise HTTPException(
@@ -219,7 +726,7 @@ async def logout(_: dict = Depends(require_auth)):
     tags=["Scraper"],
     dependencies=[Depends(require_auth)]
 )
-async def preview_from_html(raw_html: str, mode: ScrapeMode = ScrapeMode.ONE_PAGE, chinese_mode: bool = False, simplify_markdown: bool = False):
+async def preview_from_html(raw_html: str, mode: ScrapeModeName = ScrapeMode.ONE_PAGE.value, chinese_mode: bool = False, simplify_markdown: bool = False):
     """
     Preview content from raw HTML (for manual import when URL scraping fails).
 
@@ -235,90 +742,20 @@ async def preview_from_html(raw_html: str, mode: ScrapeMode = ScrapeMode.ONE_PAG
     try:
         if mode == ScrapeMode.ONE_PAGE:
             # Extract content from HTML
-            content, containers = extractor.extract_content(raw_html, track_containers=True, chinese_mode=chinese_mode, simplify_markdown=simplify_markdown)
+            content, containers = await run_in_threadpool(extractor.extract_content, raw_html, track_containers=True, chinese_mode=chinese_mode, simplify_markdown=simplify_markdown)
 
             if not content:
-                return PreviewResponse(
-                    success=False,
-                    mode=mode,
-                    content_preview="",
-                    full_length=0,
-                    metadata=PreviewMetadata(),
-                    error="No content found in HTML"
-                )
+                return _preview_error(mode, "No content found in HTML")
 
             # Extract metadata
-            metadata = extractor.extract_metadata(raw_html, "manual-import")
-
-            # Create preview
-            content_preview = content[:500]
-            if len(content) > 500:
-                content_preview += "..."
-
-            preview_metadata = PreviewMetadata(
-                title=metadata.get('title'),
-                author=metadata.get('author'),
-                language=metadata.get('language', 'en'),
-                description=metadata.get('description'),
-                tags=metadata.get('tags', [])
-            )
-
-            # Size info
-            content_bytes = len(content.encode('utf-8'))
-            compressed_content = gzip.compress(content.encode('utf-8'))
-            compressed_size = len(compressed_content)
-
-            size_info = ContentSizeInfo(
-                character_count=len(content),
-                estimated_bytes=content_bytes,
-                formatted_size=format_bytes(content_bytes),
-                compression_estimate=format_bytes(compressed_size)
-            )
-
-            # Containers
-            containers_list = None
-            if containers:
-                containers_list = [
-                    ContainerInfo(
-                        type=c['type'],
-                        id=c.get('id'),
-                        classes=c.get('classes'),
-                        content_length=c['content_length'],
-                        content_preview=c['content_preview'],
-                        selected=True
-                    )
-                    for c in containers
-                ]
+            metadata = await run_in_threadpool(extractor.extract_metadata, raw_html, "manual-import")
 
-            return PreviewResponse(
-                success=True,
-                mode=mode,
-                content_preview=content_preview,
-                full_length=len(content),
-                full_content=content,
-                metadata=preview_metadata,
-                size_info=size_info,
-                containers=containers_list
-            )
+            return _one_page_preview_response(mode, content, metadata, containers, include_full_content=True)
         else:
-            return PreviewResponse(
-                success=False,
-                mode=mode,
-                content_preview="",
-                full_length=0,
-                metadata=PreviewMetadata(),
-                error="HTML import only supports ONE_PAGE mode currently"
-            )
+            return _preview_error(mode, "HTML import only supports ONE_PAGE mode currently")
 
     except Exception as e:
-        return PreviewResponse(
-            success=False,
-            mode=mode,
-            content_preview="",
-            full_length=0,
-            metadata=PreviewMetadata(),
-            error=f"Error processing HTML: {str(e)}"
-        )
+        return _preview_error(mode, f"Error processing HTML: {str(e)}")
 
 
 @app.post(
@@ -341,7 +778,8 @@ async def preview_scrape(preview_request: PreviewRequest):
     # Handle ONE_PAGE mode
     if preview_request.mode == ScrapeMode.ONE_PAGE:
         # Scrape the page with container tracking enabled
-        result, error = extractor.scrape_page(
+        result, error = await run_in_threadpool(
+            extractor.scrape_page,
             preview_request.url,
             track_containers=True,
             selected_containers=preview_request.selected_containers,
@@ -350,120 +788,39 @@ async def preview_scrape(preview_request: PreviewRequest):
         )
 
         if error:
-            return PreviewResponse(
-                success=False,
-                mode=preview_request.mode,
-                content_preview="",
-                full_length=0,
-                metadata=PreviewMetadata(),
-                error=error
-            )
+            return _preview_error(preview_request.mode, error)
 
         try:
-            # Extract data
-            content = result['content']
-            metadata = result['metadata']
-
-            # Create preview (first 500 characters)
-            content_preview = content[:500]
-            if len(content) > 500:
-                content_preview += "..."
-
-            # Create preview metadata
-            preview_metadata = PreviewMetadata(
-                title=metadata.get('title'),
-                author=metadata.get('author'),
-                language=metadata.get('language', 'en'),
-                description=metadata.get('description'),
-                tags=metadata.get('tags', [])
-            )
-
-            # Calculate size information
-            content_bytes = len(content.encode('utf-8'))
-            compressed_content = gzip.compress(content.encode('utf-8'))
-            compressed_size = len(compressed_content)
-
-            size_info = ContentSizeInfo(
-                character_count=len(content),
-                estimated_bytes=content_bytes,
-                formatted_size=format_bytes(content_bytes),
-                compression_estimate=format_bytes(compressed_size)
-            )
-
-            # Include full content if requested (for editing)
-            full_content_response = content if preview_request.include_full_content else None
-
-            # Process containers if available
-            containers_list = None
-            if 'containers' in result and result['containers']:
-                containers_list = [
-                    ContainerInfo(
-                        type=c['type'],
-                        id=c.get('id'),
-                        classes=c.get('classes'),
-                        content_length=c['content_length'],
-                        content_preview=c['content_preview'],
-                        selected=True  # Default to selected
-                    )
-                    for c in result['containers']
-                ]
-
             # Debug logging
-            print(f"Preview request - include_full_content: {preview_request.include_full_content}")
-            print(f"Full content length: {len(content)} chars")
-            print(f"Returning full_content: {full_content_response is not None}")
-            print(f"Containers found: {len(containers_list) if containers_list else 0}")
-            if full_content_response:
-                print(f"Full content first 100 chars: {full_content_response[:100]}")
-
-            return PreviewResponse(
-                success=True,
-                mode=preview_request.mode,
-                content_preview=content_preview,
-                full_length=len(content),
-                full_content=full_content_response,
-                metadata=preview_metadata,
-                size_info=size_info,
-                containers=containers_list
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Preview request - include_full_content: %s", preview_request.include_full_content)
+                logger.debug("Full content length: %d chars", len(result['content']))
+                logger.debug("Containers found: %d", len(result.get('containers') or []))
+
+            return _one_page_preview_response(
+                preview_request.mode,
+                result['content'],
+                result['metadata'],
+                result.get('containers'),
+                include_full_content=preview_request.include_full_content
             )
 
         except Exception as e:
-            return PreviewResponse(
-                success=False,
-                mode=preview_request.mode,
-                content_preview="",
-                full_length=0,
-                metadata=PreviewMetadata(),
-                error=f"Error generating preview: {str(e)}"
-            )
+            return _preview_error(preview_request.mode, f"Error generating preview: {str(e)}")
 
     # Handle INDEX_PAGE and HYBRID modes
-    elif preview_request.mode in [ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID]:
+    elif preview_request.mode in MULTI_PAGE_MODES:
         # Fetch the index page HTML
-        html, error = extractor.fetch_page(preview_request.url)
+        html, error = await run_in_threadpool(extractor.fetch_page, preview_request.url)
         if error:
-            return PreviewResponse(
-                success=False,
-                mode=preview_request.mode,
-                content_preview="",
-                full_length=0,
-                metadata=PreviewMetadata(),
-                error=error
-            )
+            return _preview_error(preview_request.mode, error)
 
         try:
             # Extract chapter links
-            links = extractor.extract_links(html, preview_request.url)
+            links = await run_in_threadpool(extractor.extract_links, html, preview_request.url)
 
             if not links:
-                return PreviewResponse(
-                    success=False,
-                    mode=preview_request.mode,
-                    content_preview="",
-                    full_length=0,
-                    metadata=PreviewMetadata(),
-                    error="No chapter links found on this page. Try using ONE_PAGE mode instead."
-                )
+                return _preview_error(preview_request.mode, "No chapter links found on this page. Try using ONE_PAGE mode instead.")
 
             # Build chapter links list
             chapter_links = [
@@ -480,65 +837,79 @@ async def preview_scrape(preview_request: PreviewRequest):
             index_content = None
             index_length = 0
             if preview_request.mode == ScrapeMode.HYBRID:
-                content, _ = extractor.extract_content(html, track_containers=False, chinese_mode=preview_request.chinese_mode, simplify_markdown=preview_request.simplify_markdown)
+                content, _ = await run_in_threadpool(extractor.extract_content, html, track_containers=False, chinese_mode=preview_request.chinese_mode, simplify_markdown=preview_request.simplify_markdown)
                 if content:
-                    index_content = content[:500] + "..." if len(content) > 500 else content
                     index_length = len(content)
+                    index_content = content[:500] + "..." if index_length > 500 else content
 
             # Extract metadata from index page
-            metadata = extractor.extract_metadata(html, preview_request.url)
+            metadata = await run_in_threadpool(extractor.extract_metadata, html, preview_request.url)
 
-            # Create preview metadata
-            preview_metadata = PreviewMetadata(
-                title=metadata.get('title'),
-                author=metadata.get('author'),
-                language=metadata.get('language', 'en'),
-                description=metadata.get('description'),
-                tags=metadata.get('tags', [])
-            )
-
-            # Build index preview
-            index_preview = IndexPagePreview(
-                chapters=chapter_links,
-                total_chapters_found=len(chapter_links),
-                index_content=index_content,
-                index_content_length=index_length
-            )
-
-            print(f"Found {len(chapter_links)} chapter links")
+            logger.debug("Found %d chapter links", len(chapter_links))
             if index_content:
-                print(f"Index content length: {index_length} chars")
-
-            return PreviewResponse(
-                success=True,
-                mode=preview_request.mode,
-                content_preview="",  # Not used for INDEX/HYBRID
-                full_length=0,
-                metadata=preview_metadata,
-                index_preview=index_preview
+                logger.debug("Index content length: %d chars", index_length)
+
+            return _index_preview_response(
+                preview_request.mode,
+                chapter_links,
+                metadata,
+                index_content,
+                index_length
             )
 
         except Exception as e:
-            return PreviewResponse(
-                success=False,
-                mode=preview_request.mode,
-                content_preview="",
-                full_length=0,
-                metadata=PreviewMetadata(),
-                error=f"Error analyzing index page: {str(e)}"
-            )
+            return _preview_error(preview_request.mode, f"Error analyzing index page: {str(e)}")
 
     # Invalid mode
     else:
-        return PreviewResponse(
-            success=False,
-            mode=preview_request.mode,
-            content_preview="",
-            full_length=0,
-            metadata=PreviewMetadata(),
-            error=f"Unknown mode: {preview_request.mode}"
+        return _preview_error(preview_request.mode, f"Unknown mode: {preview_request.mode}")
+
+
+@app.get(
+    "/api/scraper/preview/{content_token}/content",
+    tags=["Scraper"],
+    dependencies=[Depends(require_auth)]
+)
+async def get_preview_content(content_token: str):
+    """
+    Stream the full content of a recent ONE_PAGE preview as plain text.
+
+    Large pages are sent in chunks rather than JSON-encoded inside the
+    preview response.
+
+    Args:
+        content_token: Token returned in the preview's content_token field
+
+    Returns:
+        Full extracted content (text/plain, chunked)
+    """
+    content_utf8 = preview_content_cache.get(content_token)
+    if content_utf8 is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview content not found or expired"
         )
 
+    return StreamingResponse(
+        _iter_content_chunks(content_utf8),
+        media_type="text/plain"
+    )
+
+
+def _metadata_overrides(scrape_request: ScrapeRequest) -> dict:
+    """
+    Get the metadata overrides a scrape request actually sent.
+
+    Args:
+        scrape_request: Scrape request
+
+    Returns:
+        New dict with only the override fields present in the request body
+    """
+    if scrape_request.metadata_overrides is None:
+        return {}
+    return scrape_request.metadata_overrides.model_dump(exclude_unset=True)
+
 
 @app.post(
     "/api/scraper/execute",
@@ -566,14 +937,14 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                 content = scrape_request.custom_content
 
                 # For custom content, metadata must come from overrides or defaults
-                metadata = scrape_request.metadata_overrides or {}
+                metadata = _metadata_overrides(scrape_request)
                 if 'title' not in metadata:
                     metadata['title'] = 'Untitled'
                 if 'language' not in metadata:
                     metadata['language'] = 'en'
             else:
                 # Scrape the page
-                result, error = extractor.scrape_page(scrape_request.url, chinese_mode=scrape_request.chinese_mode, simplify_markdown=scrape_request.simplify_markdown)
+                result, error = await run_in_threadpool(extractor.scrape_page, scrape_request.url, chinese_mode=scrape_request.chinese_mode, simplify_markdown=scrape_request.simplify_markdown)
 
                 if error:
                     return ScrapeResponse(
@@ -587,11 +958,11 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                 metadata = result['metadata']
 
                 # Apply metadata overrides if provided
-                if scrape_request.metadata_overrides:
-                    metadata.update(scrape_request.metadata_overrides)
+                metadata.update(_metadata_overrides(scrape_request))
 
             # Save book
-            book_id = storage.save_book(
+            book_id = await run_in_threadpool(
+                storage.save_book,
                 title=metadata.get('title', 'Untitled'),
                 content=content,
                 source_url=scrape_request.url,
@@ -624,31 +995,52 @@ async def execute_scrape(scrape_request: ScrapeRequest):
             )
 
     # Handle INDEX_PAGE and HYBRID modes
-    elif scrape_request.mode in [ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID]:
+    elif scrape_request.mode in MULTI_PAGE_MODES:
         try:
             chapters_content = []
             errors = []
+            total_bytes = 0  # Exact UTF-8 size of saved chapters
 
             # If HYBRID mode, scrape index page content first
             if scrape_request.mode == ScrapeMode.HYBRID:
-                html, error = extractor.fetch_page(scrape_request.url)
+                html, error = await run_in_threadpool(extractor.fetch_page, scrape_request.url)
                 if not error:
-                    content, _ = extractor.extract_content(html, track_containers=False, chinese_mode=scrape_request.chinese_mode, simplify_markdown=scrape_request.simplify_markdown)
+                    content, _ = await run_in_threadpool(extractor.extract_content, html, track_containers=False, chinese_mode=scrape_request.chinese_mode, simplify_markdown=scrape_request.simplify_markdown)
                     if content:
                         chapters_content.append({
                             'title': 'Index',
                             'content': content,
                             'url': scrape_request.url
                         })
+                        total_bytes += len(content.encode('utf-8'))
                 else:
                     errors.append(f"Failed to scrape index page: {error}")
 
-            # Scrape selected chapter URLs
+            # Scrape selected chapter URLs concurrently (bounded), keeping original order
             if scrape_request.selected_chapters:
-                for idx, chapter_url in enumerate(scrape_request.selected_chapters):
-                    print(f"Scraping chapter {idx + 1}/{len(scrape_request.selected_chapters)}: {chapter_url}")
+                semaphore = asyncio.Semaphore(CONCURRENT_CHAPTERS)
+                total_chapters = len(scrape_request.selected_chapters)
+                outcomes = await asyncio.gather(
+                    *[
+                        _scrape_chapter(
+                            semaphore,
+                            idx,
+                            total_chapters,
+                            chapter_url,
+                            chinese_mode=scrape_request.chinese_mode,
+                            simplify_markdown=scrape_request.simplify_markdown
+                        )
+                        for idx, chapter_url in enumerate(scrape_request.selected_chapters)
+                    ],
+                    return_exceptions=True
+                )
 
-                    result, error = extractor.scrape_page(chapter_url, chinese_mode=scrape_request.chinese_mode, simplify_markdown=scrape_request.simplify_markdown)
+                for idx, (chapter_url, outcome) in enumerate(zip(scrape_request.selected_chapters, outcomes)):
+                    if isinstance(outcome, Exception):
+                        errors.append(f"Failed to scrape {chapter_url}: {str(outcome)}")
+                        continue
+
+                    result, error = outcome
                     if error:
                         errors.append(f"Failed to scrape {chapter_url}: {error}")
                         continue
@@ -664,6 +1056,7 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                         'content': result['content'],
                         'url': chapter_url
                     })
+                    total_bytes += len(result['content'].encode('utf-8'))
 
             # Check if we have any chapters
             if not chapters_content:
@@ -674,7 +1067,7 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                 )
 
             # Get metadata (from overrides or first scraped content)
-            metadata = scrape_request.metadata_overrides or {}
+            metadata = _metadata_overrides(scrape_request)
             if not metadata.get('title'):
                 # Use book title from overrides, or default
                 metadata['title'] = 'Untitled Book'
@@ -682,7 +1075,7 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                 metadata['language'] = 'en'
 
             # Save book with multiple chapters
-            book_id = storage.save_multi_chapter_book(
+            book_id = await storage.save_multi_chapter_book_async(
                 title=metadata.get('title'),
                 chapters=chapters_content,
                 source_url=scrape_request.url,
@@ -693,12 +1086,7 @@ async def execute_scrape(scrape_request: ScrapeRequest):
                 scrape_mode=scrape_request.mode
             )
 
-            # Calculate total size
-            total_chars = sum(len(ch['content']) for ch in chapters_content)
-            content_size = total_chars * 2  # Rough estimate for UTF-8
-            size_str = f"{content_size / 1024:.2f}KB"
-            if content_size > 1024 * 1024:
-                size_str = f"{content_size / (1024 * 1024):.2f}MB"
+            size_str = format_bytes(total_bytes)
 
             success_msg = "Book scraped and saved successfully"
             if errors:
@@ -746,7 +1134,8 @@ async def create_book(request: CreateBookRequest):
         Book ID for the newly created book
     """
     try:
-        book_id = storage.create_book_with_metadata(
+        book_id = await run_in_threadpool(
+            storage.create_book_with_metadata,
             title=request.title,
             source_url=request.source_url,
             author=request.author,
@@ -788,60 +1177,21 @@ async def add_chapter(request: AddChapterRequest):
     """
     try:
         # Verify book exists
-        if not storage.book_exists(request.book_id):
+        if not await run_in_threadpool(storage.book_exists, request.book_id):
             return AddChapterResponse(
                 success=False,
                 error="Book not found",
                 message=f"Book {request.book_id} does not exist"
             )
 
-        # Check if custom content is provided
-        if request.custom_content:
-            # Use custom content instead of scraping
-            chapter_content = request.custom_content
-            chapter_title = request.chapter_name
-        else:
-            # Scrape the chapter
-            if request.selected_containers is not None:
-                # Use selected containers
-                html, error = extractor.fetch_page(request.chapter_url)
-                if error:
-                    return AddChapterResponse(
-                        success=False,
-                        error=error,
-                        message=f"Failed to fetch chapter: {error}"
-                    )
-
-                # Extract content and get containers
-                chapter_content, containers = extractor.extract_content(
-                    html,
-                    track_containers=True,
-                    chinese_mode=request.chinese_mode,
-                    simplify_markdown=request.simplify_markdown
-                )
-
-                # Re-extract with only selected containers
-                if containers:
-                    chapter_content = extractor.extract_content_from_selected_containers(
-                        html, containers, request.selected_containers
-                    )
-            else:
-                # Normal scraping
-                result, error = extractor.scrape_page(request.chapter_url, chinese_mode=request.chinese_mode, simplify_markdown=request.simplify_markdown)
-
-                if error:
-                    return AddChapterResponse(
-                        success=False,
-                        error=error,
-                        message=f"Failed to scrape chapter: {error}"
-                    )
-
-                chapter_content = result['content']
+        chapter_content, error_response = await _load_chapter_content(request)
+        if error_response:
+            return error_response
 
-            chapter_title = request.chapter_name
+        chapter_title = request.chapter_name
 
-        # Add chapter to book
-        success = storage.add_chapter_to_book(
+        # Add chapter to book (coalesced with concurrent writes to the same book)
+        success = await chapter_batcher.submit(
             book_id=request.book_id,
             chapter_title=chapter_title,
             chapter_content=chapter_content,
@@ -869,6 +1219,108 @@ async def add_chapter(request: AddChapterRequest):
         )
 
 
+@app.post(
+    "/api/scraper/add-chapters",
+    response_model=AddChaptersResponse,
+    tags=["Scraper"],
+    dependencies=[Depends(require_auth)]
+)
+async def add_chapters(request: AddChaptersRequest):
+    """
+    Add several chapters to an existing book in one request.
+    Chapters are scraped concurrently and saved in a single storage transaction.
+
+    Args:
+        request: Book ID and the chapters to add
+
+    Returns:
+        Overall status plus per-chapter results in request order
+    """
+    try:
+        # Verify book exists
+        if not await run_in_threadpool(storage.book_exists, request.book_id):
+            return AddChaptersResponse(
+                success=False,
+                error="Book not found",
+                message=f"Book {request.book_id} does not exist"
+            )
+
+        semaphore = asyncio.Semaphore(CONCURRENT_CHAPTERS)
+
+        async def load(spec: ChapterSpec):
+            async with semaphore:
+                return await _load_chapter_content(spec)
+
+        outcomes = await asyncio.gather(
+            *[load(spec) for spec in request.chapters],
+            return_exceptions=True
+        )
+
+        results = [None] * len(request.chapters)
+        to_save = []
+        for position, (spec, outcome) in enumerate(zip(request.chapters, outcomes)):
+            if isinstance(outcome, Exception):
+                results[position] = AddChapterResponse(
+                    success=False,
+                    error=str(outcome),
+                    message=f"Error adding chapter: {str(outcome)}"
+                )
+                continue
+
+            chapter_content, error_response = outcome
+            if error_response:
+                results[position] = error_response
+                continue
+
+            to_save.append((position, spec, chapter_content))
+
+        success = True
+        if to_save:
+            success = await run_in_threadpool(
+                storage.add_chapters_to_book,
+                request.book_id,
+                [
+                    {
+                        'title': spec.chapter_name,
+                        'content': chapter_content,
+                        'index': spec.chapter_index
+                    }
+                    for _, spec, chapter_content in to_save
+                ]
+            )
+
+        for position, spec, _ in to_save:
+            if success:
+                results[position] = AddChapterResponse(
+                    success=True,
+                    chapter_id=spec.chapter_index,
+                    message=f"Chapter '{spec.chapter_name}' added successfully"
+                )
+            else:
+                results[position] = AddChapterResponse(
+                    success=False,
+                    error="Storage error",
+                    message="Failed to add chapter to book"
+                )
+
+        chapters_added = len(to_save) if success else 0
+        message = f"Added {chapters_added} of {len(request.chapters)} chapters"
+
+        return AddChaptersResponse(
+            success=chapters_added > 0 or not request.chapters,
+            chapters_added=chapters_added,
+            results=results,
+            message=message
+        )
+
+    except Exception as e:
+        return AddChaptersResponse(
+            success=False,
+            error=str(e),
+            message=f"Error adding chapters: {str(e)}"
+        )
+
+
 # ==================== Books Endpoints ====================
 
 @app.get(
@@ -884,12 +1336,15 @@ async def list_books():
     Returns:
         List of books with metadata
     """
-    books = storage.list_books()
+    books = await run_in_threadpool(storage.list_books)
 
-    return BookListResponse(
+    # Rows come from validated metadata; serialize straight to JSON with the
+    # model's compiled serializer instead of letting FastAPI re-validate them
+    response = BookListResponse.model_construct(
         books=books,
         total=len(books)
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @app.get(
@@ -898,17 +1353,18 @@ async def list_books():
     tags=["Books"],
     dependencies=[Depends(require_auth)]
 )
-async def get_book(book_id: str):
+async def get_book(book_id: str, request: Request):
     """
     Get detailed information about a specific book.
 
     Args:
         book_id: Book ID
+        request: Incoming request (for If-None-Match)
 
     Returns:
         Book metadata and chapter list
     """
-    metadata = storage.get_book(book_id)
+    metadata = await run_in_threadpool(storage.get_book, book_id)
 
     if not metadata:
         raise HTTPException(
@@ -916,12 +1372,14 @@ async def get_book(book_id: str):
             detail=f"Book '{book_id}' not found"
         )
 
-    chapters = storage.get_chapters(book_id)
+    chapters = await run_in_threadpool(storage.get_chapters, book_id)
 
-    return BookDetailResponse(
+    # Metadata and chapters were validated when loaded from storage
+    body, etag = _json_body_with_etag(BookDetailResponse.model_construct(
         metadata=metadata,
         chapters=chapters or []
-    )
+    ))
+    return _conditional_json_response(request, body, etag)
 
 
 @app.get(
@@ -930,26 +1388,75 @@ async def get_book(book_id: str):
     tags=["Books"],
     dependencies=[Depends(require_auth)]
 )
-async def get_chapter(book_id: str, chapter_id: int):
+async def get_chapter(book_id: str, chapter_id: int, request: Request):
     """
     Get content for a specific chapter.
 
     Args:
         book_id: Book ID
         chapter_id: Chapter ID (0-indexed)
+        request: Incoming request (for If-None-Match)
 
     Returns:
         Chapter content with navigation info
     """
-    chapter_content = storage.get_chapter_content(book_id, chapter_id)
+    # Cached bodies are keyed by the stat signatures of index.json and the
+    # chapter file, so any change on disk (from this worker, another worker or
+    # a manual edit) makes them unreachable
+    signature = await run_in_threadpool(storage.chapter_signature, book_id, chapter_id)
+    cache_key = (book_id, chapter_id, signature)
+    cached = chapter_response_cache.get(cache_key) if signature else None
 
-    if not chapter_content:
+    if cached is None:
+        chapter_content = await run_in_threadpool(storage.get_chapter_content, book_id, chapter_id)
+
+        if not chapter_content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Chapter {chapter_id} not found in book '{book_id}'"
+            )
+
+        cached = _json_body_with_etag(chapter_content)
+        if signature:
+            chapter_response_cache.put(cache_key, cached)
+
+    body, etag = cached
+    return _conditional_json_response(request, body, etag)
+
+
+@app.get(
+    "/api/books/{book_id}/chapters/{chapter_id}/content",
+    response_class=FileResponse,
+    tags=["Books"],
+    dependencies=[Depends(require_auth)]
+)
+async def get_chapter_markdown(book_id: str, chapter_id: int):
+    """
+    Stream the raw markdown of a chapter.
+
+    Unlike the JSON chapter endpoint, the file is sent as-is in chunks, so
+    large chapters are never decoded, escaped or held in memory whole.
+
+    Args:
+        book_id: Book ID
+        chapter_id: Chapter ID (0-indexed)
+
+    Returns:
+        Chapter markdown file
+    """
+    chapter_path = await run_in_threadpool(storage.get_chapter_file, book_id, chapter_id)
+
+    if not chapter_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chapter {chapter_id} not found in book '{book_id}'"
         )
 
-    return chapter_content
+    return FileResponse(
+        chapter_path,
+        media_type="text/markdown",
+        headers={"Cache-Control": BOOK_CACHE_CONTROL}
+    )
 
 
 @app.delete(
@@ -968,7 +1475,7 @@ async def delete_book(book_id: str):
     Returns:
         Success message
     """
-    success = storage.delete_book(book_id)
+    success = await run_in_threadpool(storage.delete_book, book_id)
 
     if not success:
         raise HTTPException(
@@ -1027,7 +1534,7 @@ async def import_file(
 
     # Parse file
     try:
-        parsed = FileParser.parse_file(file_content, filename, file_ext)
+        parsed = await _parse_import_file(file_content, filename, file_ext)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1064,7 +1571,8 @@ async def import_file(
 
     # Save book
     try:
-        book_id = storage.save_book(
+        book_id = await run_in_threadpool(
+            storage.save_book,
             content=parsed['content'],
             metadata=book_metadata,
             chapter_name=final_title
@@ -1113,28 +1621,55 @@ async def validate_folder(file: UploadFile = File(...)):
     # Read ZIP content
     zip_content = await file.read()
 
-    # Create temporary directory for extraction
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # Validate and preview (the archive is inspected in memory)
+    try:
+        result = await run_in_threadpool(FolderValidator.validate_and_preview, zip_content)
+
+        return ValidateFolderResponse(
+            valid=result['valid'],
+            errors=result['errors'],
+            warnings=result['warnings'],
+            metadata=result['metadata'],
+            index=result['index'],
+            chapters_count=result['chapters_count'],
+            folder_path=result['folder_path']
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Validation failed: {str(e)}"
+        )
 
-        # Validate and preview
-        try:
-            result = FolderValidator.validate_and_preview(zip_content, temp_path)
-
-            return ValidateFolderResponse(
-                valid=result['valid'],
-                errors=result['errors'],
-                warnings=result['warnings'],
-                metadata=result['metadata'],
-                index=result['index'],
-                chapters_count=result['chapters_count'],
-                folder_path=result['folder_path']
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Validation failed: {str(e)}"
-            )
+
+def _read_archive_chapters(zip_content: bytes, validation: dict) -> list:
+    """
+    Read the chapters of a validated folder import from its ZIP archive.
+
+    Args:
+        zip_content: ZIP file bytes
+        validation: Result of FolderValidator.validate_and_preview
+
+    Returns:
+        List of chapter dicts with 'title' and 'content'
+    """
+    chapter_files = validation['chapter_files']
+
+    with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+        folder_path = FolderValidator.archive_folder(zf)
+        contents = FolderValidator.read_all_chapters(folder_path, chapter_files)
+
+    # Chapter titles from the index, first entry per file wins
+    titles = {}
+    for ch in validation['index']['chapters']:
+        titles.setdefault(ch['file'], ch['title'])
+
+    return [
+        {
+            'title': titles.get(chapter_file, f"Chapter {idx}"),
+            'content': content
+        }
+        for idx, (chapter_file, content) in enumerate(zip(chapter_files, contents))
+    ]
 
 
 @app.post(
@@ -1175,74 +1710,56 @@ async def import_folder(
     # Read ZIP content
     zip_content = await file.read()
 
-    # Create temporary directory for extraction
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Validate first
-        try:
-            validation = FolderValidator.validate_and_preview(zip_content, temp_path)
-
-            if not validation['valid']:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid folder structure: {', '.join(validation['errors'])}"
-                )
-
-            # Get folder path and read chapters
-            folder_path = Path(validation['folder_path'])
-            chapters = []
+    # Validate first (the archive is inspected in memory)
+    try:
+        validation = await run_in_threadpool(FolderValidator.validate_and_preview, zip_content)
 
-            for chapter_file in validation['chapter_files']:
-                content = FolderValidator.read_chapter_content(folder_path, chapter_file)
-                # Get chapter title from index
-                chapter_info = next(
-                    (ch for ch in validation['index']['chapters'] if ch['file'] == chapter_file),
-                    None
-                )
-                chapter_title = chapter_info['title'] if chapter_info else f"Chapter {len(chapters)}"
-
-                chapters.append({
-                    'title': chapter_title,
-                    'content': content
-                })
-
-            # Override metadata with user input if provided
-            final_metadata = validation['metadata'].copy()
-            if title:
-                final_metadata['title'] = title
-            if author:
-                final_metadata['author'] = author
-            if language:
-                final_metadata['language'] = language
-            if description:
-                final_metadata['description'] = description
-            if tags:
-                try:
-                    final_metadata['tags'] = json.loads(tags)
-                except json.JSONDecodeError:
-                    pass
-
-            # Save multi-chapter book
-            book_id = storage.save_multi_chapter_book(
-                chapters=chapters,
-                metadata=final_metadata
+        if not validation['valid']:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid folder structure: {', '.join(validation['errors'])}"
             )
 
-            return ImportFolderResponse(
-                success=True,
-                book_id=book_id,
-                message=f"Folder imported successfully with {len(chapters)} chapters",
-                chapters_imported=len(chapters)
-            )
+        # Read chapters straight from the archive
+        chapters = await run_in_threadpool(_read_archive_chapters, zip_content, validation)
+
+        # Override metadata with user input if provided
+        final_metadata = validation['metadata'].copy()
+        if title:
+            final_metadata['title'] = title
+        if author:
+            final_metadata['author'] = author
+        if language:
+            final_metadata['language'] = language
+        if description:
+            final_metadata['description'] = description
+        if tags:
+            try:
+                final_metadata['tags'] = json.loads(tags)
+            except json.JSONDecodeError:
+                pass
+
+        # Save multi-chapter book
+        book_id = await run_in_threadpool(
+            storage.save_multi_chapter_book,
+            chapters=chapters,
+            metadata=final_metadata
+        )
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Import failed: {str(e)}"
-            )
+        return ImportFolderResponse(
+            success=True,
+            book_id=book_id,
+            message=f"Folder imported successfully with {len(chapters)} chapters",
+            chapters_imported=len(chapters)
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Import failed: {str(e)}"
+        )
 
 
 # ==================== System Endpoints ====================
@@ -1259,7 +1776,7 @@ async def get_storage_stats():
     Returns:
         Storage information
     """
-    stats = storage.get_storage_stats()
+    stats = await run_in_threadpool(storage.get_storage_stats)
     return stats
 
 
@@ -1267,26 +1784,26 @@ async def get_storage_stats():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             error=exc.detail,
             detail=str(exc.detail) if hasattr(exc, 'detail') else None,
             status_code=exc.status_code
-        ).dict()
+        ).model_dump()
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle general exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=ErrorResponse(
             error="Internal server error",
             detail=str(exc),
             status_code=500
-        ).dict()
+        ).model_dump()
     )
 
 
@@ -1296,18 +1813,26 @@ if __name__ == "__main__":
 
     host = os.getenv("APP_HOST", "0.0.0.0")
     port = int(os.getenv("APP_PORT", "8000"))
+    workers = int(os.getenv("APP_WORKERS", "1"))
+    # Auto-reload is for development and only runs a single worker
+    reload = os.getenv("APP_RELOAD", "true").lower() == "true" and workers == 1
 
     print(f"\n{'='*60}")
     print(f"📚 Book Scraper & Reader API - Phase 1")
     print(f"{'='*60}")
     print(f"🚀 Starting server on http://{host}:{port}")
     print(f"📖 API docs available at http://{host}:{port}/docs")
-    print(f"🔒 PIN: {APP_PIN}")
+    print(f"🔒 PIN: {APP_PIN if not APP_PIN_HASH else '(set via APP_PIN_HASH)'}")
     print(f"{'='*60}\n")
 
+    # Pin the C event loop and HTTP parser from uvicorn[standard] rather than
+    # silently falling back to asyncio's loop and h11 if they are missing
     uvicorn.run(
         "backend.app:app",
         host=host,
         port=port,
-        reload=True
+        reload=reload,
+        workers=workers,
+        loop=os.getenv("APP_LOOP", "uvloop"),
+        http=os.getenv("APP_HTTP", "httptools")
     )
@@ -2,12 +2,16 @@
 PIN-based authentication with JWT tokens.
 """
 import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import bcrypt
-from jose import JWTError, jwt
-from fastapi import HTTPException, Security, Depends
+from jose import JWTError, jwk, jwt
+from fastapi import HTTPException, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 
@@ -15,6 +19,79 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 security = HTTPBearer()
 
 
+class TokenCache:
+    """
+    Bounded LRU cache of verified JWT payloads.
+
+    Entries are keyed by the SHA-256 digest of the token (never the raw
+    token) and expire at the earlier of the token's own ``exp`` claim and
+    ``now + ttl_seconds``.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 5.0):
+        """
+        Initialize the token cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens
+            ttl_seconds: Maximum time a verified token stays cached
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Build the cache key for a token."""
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """
+        Look up a previously verified token.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            Cached payload, or None on a miss or expired entry
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(payload)
+
+    def put(self, token: str, payload: dict):
+        """
+        Cache the payload of a successfully verified token.
+
+        Args:
+            token: JWT token string
+            payload: Decoded token payload
+        """
+        if self.ttl_seconds <= 0 or self.maxsize <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
 class AuthManager:
     """Manages PIN authentication and JWT tokens."""
 
@@ -23,22 +100,41 @@ class AuthManager:
         pin: str,
         secret_key: str,
         algorithm: str = "HS256",
-        expiration_hours: int = 24
+        expiration_hours: int = 24,
+        cache_ttl_seconds: float = 5.0,
+        pin_hash: Optional[bytes] = None,
+        bcrypt_rounds: int = 12
     ):
         """
         Initialize the authentication manager.
 
         Args:
-            pin: Plain text PIN (will be hashed)
+            pin: Plain text PIN (will be hashed unless pin_hash is given)
             secret_key: Secret key for JWT signing
             algorithm: JWT algorithm
             expiration_hours: Token expiration time in hours
+            cache_ttl_seconds: How long verified tokens are cached (0 disables)
+            pin_hash: Precomputed bcrypt hash of the PIN (skips hashing at startup)
+            bcrypt_rounds: bcrypt cost factor used when hashing the PIN
         """
-        # Hash the PIN using bcrypt
-        self.pin_hash = bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt())
+        # Hash the PIN using bcrypt, unless a hash was generated ahead of time
+        if pin_hash:
+            self.pin_hash = pin_hash
+        else:
+            self.pin_hash = bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt(rounds=bcrypt_rounds))
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.expiration_hours = expiration_hours
+        self.token_cache = TokenCache(ttl_seconds=cache_ttl_seconds)
+
+        # Build the signing key and decode settings once rather than on every call
+        self._signing_key = jwk.construct(secret_key, algorithm)
+        self._algorithms = [algorithm]
+        self._decode_options = {
+            "require_exp": True,
+            "require_iat": True,
+            "require_sub": True
+        }
 
     def verify_pin(self, pin: str) -> bool:
         """
@@ -71,7 +167,7 @@ class AuthManager:
         # Create token
         encoded_jwt = jwt.encode(
             to_encode,
-            self.secret_key,
+            self._signing_key,
             algorithm=self.algorithm
         )
 
@@ -87,16 +183,25 @@ class AuthManager:
         Returns:
             Decoded token data if valid, None otherwise
         """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
+            # Signature, expiry and required claims are all checked in this one decode
             payload = jwt.decode(
                 token,
-                self.secret_key,
-                algorithms=[self.algorithm]
+                self._signing_key,
+                algorithms=self._algorithms,
+                options=self._decode_options
             )
-            return payload
         except JWTError:
             return None
 
+        # Only successfully verified tokens are cached
+        self.token_cache.put(token, payload)
+        return payload
+
     def authenticate(self, pin: str) -> Optional[str]:
         """
         Authenticate with PIN and return a JWT token.
@@ -123,7 +228,10 @@ def init_auth(
     pin: str,
     secret_key: str,
     algorithm: str = "HS256",
-    expiration_hours: int = 24
+    expiration_hours: int = 24,
+    cache_ttl_seconds: float = 5.0,
+    pin_hash: Optional[bytes] = None,
+    bcrypt_rounds: int = 12
 ):
     """
     Initialize the global authentication manager.
@@ -133,9 +241,20 @@ def init_auth(
         secret_key: Secret key for JWT signing
         algorithm: JWT algorithm
         expiration_hours: Token expiration time in hours
+        cache_ttl_seconds: How long verified tokens are cached (0 disables)
+        pin_hash: Precomputed bcrypt hash of the PIN (skips hashing at startup)
+        bcrypt_rounds: bcrypt cost factor used when hashing the PIN
     """
     global _auth_manager
-    _auth_manager = AuthManager(pin, secret_key, algorithm, expiration_hours)
+    _auth_manager = AuthManager(
+        pin,
+        secret_key,
+        algorithm,
+        expiration_hours,
+        cache_ttl_seconds,
+        pin_hash=pin_hash,
+        bcrypt_rounds=bcrypt_rounds
+    )
 
 
 def get_auth_manager() -> AuthManager:
@@ -188,12 +307,19 @@ async def verify_auth_token(
     return payload
 
 
-def require_auth(token_payload: dict = Depends(verify_auth_token)) -> dict:
+async def require_auth(
+    credentials: HTTPAuthorizationCredentials = Security(security)
+) -> dict:
     """
     FastAPI dependency for routes that require authentication.
 
+    Declared async so the (usually cached) check runs on the event loop
+    instead of being dispatched to the threadpool on every request, and
+    calls verify_auth_token directly so FastAPI resolves one dependency
+    per request rather than a chain of two.
+
     Args:
-        token_payload: Token payload from verify_auth_token
+        credentials: HTTP authorization credentials
 
     Returns:
         Token payload
@@ -201,6 +327,8 @@ def require_auth(token_payload: dict = Depends(verify_auth_token)) -> dict:
     Raises:
         HTTPException: If not authenticated
     """
+    token_payload = await verify_auth_token(credentials)
+
     if not token_payload.get("authenticated"):
         raise HTTPException(
             status_code=401,
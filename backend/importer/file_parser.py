@@ -4,11 +4,32 @@ File Parser for Manual Book Imports
 Handles parsing of .txt and .md files for single-file book imports.
 """
 
-import chardet
+import re
+from chardet.universaldetector import UniversalDetector
 from pathlib import Path
 from typing import Dict, Optional
 
 
+# Character runs per script, in the order detect_language checks them
+LANGUAGE_CHAR_RUN_PATTERNS = (
+    ('zh', re.compile('[\u4e00-\u9fff]+')),
+    ('ja', re.compile('[\u3040-\u309f\u30a0-\u30ff]+')),
+    ('ko', re.compile('[\uac00-\ud7af]+')),
+    ('ar', re.compile('[\u0600-\u06ff]+')),
+    ('ru', re.compile('[\u0400-\u04ff]+')),
+)
+
+# Encoding detection reads the file in chunks of this size until it is confident
+ENCODING_DETECT_CHUNK_BYTES = 64 * 1024
+
+# Longer texts are classified from their start, middle and end only
+LANGUAGE_SAMPLE_THRESHOLD = 200_000
+LANGUAGE_SAMPLE_CHARS = 50_000
+
+# Title detection only looks at the first few lines
+TITLE_SCAN_LINES = 10
+
+
 class FileParser:
     """
     Parser for text and markdown files.
@@ -22,13 +43,21 @@ class FileParser:
         """
         Detect file encoding using chardet.
 
+        The file is fed to chardet incrementally and detection stops as soon
+        as it is certain, so most files are decided from the first chunk.
+
         Args:
             file_content: Raw file bytes
 
         Returns:
             Detected encoding (e.g., 'utf-8', 'gbk', 'iso-8859-1')
         """
-        result = chardet.detect(file_content)
+        detector = UniversalDetector()
+        for start in range(0, len(file_content), ENCODING_DETECT_CHUNK_BYTES):
+            detector.feed(file_content[start:start + ENCODING_DETECT_CHUNK_BYTES])
+            if detector.done:
+                break
+        result = detector.close()
         encoding = result.get('encoding', 'utf-8')
 
         # Default to utf-8 if detection fails or confidence is low
@@ -54,10 +83,11 @@ class FileParser:
         Returns:
             Extracted or fallback title
         """
-        lines = content.strip().split('\n')
+        # Only the first lines are inspected, so don't split the whole book
+        lines = content.lstrip().split('\n', TITLE_SCAN_LINES)[:TITLE_SCAN_LINES]
 
         # Try to find markdown heading
-        for line in lines[:10]:  # Check first 10 lines
+        for line in lines:
             line = line.strip()
             if line.startswith('# '):
                 return line[2:].strip()
@@ -84,28 +114,30 @@ class FileParser:
         Returns:
             Language code (e.g., 'en', 'zh', 'ja')
         """
-        # Simple heuristic: check for Chinese, Japanese, Korean characters
-        chinese_chars = sum(1 for char in content if '\u4e00' <= char <= '\u9fff')
-        japanese_chars = sum(1 for char in content if '\u3040' <= char <= '\u309f' or '\u30a0' <= char <= '\u30ff')
-        korean_chars = sum(1 for char in content if '\uac00' <= char <= '\ud7af')
-        arabic_chars = sum(1 for char in content if '\u0600' <= char <= '\u06ff')
-        cyrillic_chars = sum(1 for char in content if '\u0400' <= char <= '\u04ff')
+        # Pure ASCII text cannot contain any of the scripts below (O(1) check)
+        if content.isascii():
+            return 'en'
+
+        # Large books: three slices are plenty to tell the script apart
+        if len(content) > LANGUAGE_SAMPLE_THRESHOLD:
+            middle = len(content) // 2
+            half = LANGUAGE_SAMPLE_CHARS // 2
+            content = (
+                content[:LANGUAGE_SAMPLE_CHARS] +
+                content[middle - half:middle + half] +
+                content[-LANGUAGE_SAMPLE_CHARS:]
+            )
 
         total_chars = len(content)
         if total_chars == 0:
             return 'en'
 
-        # If >30% CJK characters, classify as respective language
-        if chinese_chars / total_chars > 0.3:
-            return 'zh'
-        if japanese_chars / total_chars > 0.3:
-            return 'ja'
-        if korean_chars / total_chars > 0.3:
-            return 'ko'
-        if arabic_chars / total_chars > 0.3:
-            return 'ar'
-        if cyrillic_chars / total_chars > 0.3:
-            return 'ru'
+        # Simple heuristic: if >30% of characters belong to one script, classify
+        # as that language (runs are matched in C rather than char by char)
+        for language, pattern in LANGUAGE_CHAR_RUN_PATTERNS:
+            script_chars = sum(map(len, pattern.findall(content)))
+            if script_chars / total_chars > 0.3:
+                return language
 
         # Default to English
         return 'en'
@@ -125,11 +157,8 @@ class FileParser:
         Returns:
             Markdown formatted text
         """
-        # Split into paragraphs
-        paragraphs = content.split('\n\n')
-
-        # Filter out empty paragraphs
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+        # Split into paragraphs, strip each once and drop the empty ones
+        paragraphs = filter(None, map(str.strip, content.split('\n\n')))
 
         # Join with proper markdown paragraph spacing
         markdown = '\n\n'.join(paragraphs)
@@ -4,12 +4,16 @@ Folder Validator for Manual Book Imports
 Handles validation and parsing of folder-based book imports.
 """
 
-import json
+import io
+import os
+import re
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+import orjson
+
 
 class FolderValidator:
     """
@@ -20,6 +24,7 @@ class FolderValidator:
     REQUIRED_FILES = ['metadata.json', 'index.json']
     REQUIRED_DIRS = ['chapters']
     CHAPTER_PATTERN = r'^\d{3}\.md$'
+    _CHAPTER_RE = re.compile(CHAPTER_PATTERN)
 
     @staticmethod
     def extract_zip(zip_content: bytes, extract_path: Path) -> Path:
@@ -36,8 +41,6 @@ class FolderValidator:
         Raises:
             ValueError: If ZIP is invalid
         """
-        import io
-
         try:
             with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
                 # Get root folder name (first component of all paths)
@@ -60,8 +63,8 @@ class FolderValidator:
         except zipfile.BadZipFile:
             raise ValueError("Invalid ZIP file")
 
-    @staticmethod
-    def validate_structure(folder_path: Path) -> Dict[str, any]:
+    @classmethod
+    def validate_structure(cls, folder_path: Path) -> Dict[str, any]:
         """
         Validate folder structure and return validation report.
 
@@ -78,39 +81,97 @@ class FolderValidator:
                 - chapters_dir_exists: bool
                 - chapter_files: List[str] - Found chapter files
         """
-        errors = []
-        warnings = []
-        metadata_exists = False
-        index_exists = False
-        chapters_dir_exists = False
         chapter_files = []
 
-        # Check for metadata.json
-        metadata_path = folder_path / 'metadata.json'
-        if metadata_path.exists():
-            metadata_exists = True
-        else:
-            warnings.append("metadata.json not found (will be generated)")
-
-        # Check for index.json
-        index_path = folder_path / 'index.json'
-        if index_path.exists():
-            index_exists = True
-        else:
-            warnings.append("index.json not found (will be generated)")
+        # One scandir of the book folder answers every existence check
+        try:
+            with os.scandir(folder_path) as entries:
+                top_level = {entry.name: entry for entry in entries}
+        except OSError:
+            top_level = {}
 
         # Check for chapters directory
-        chapters_dir = folder_path / 'chapters'
-        if chapters_dir.exists() and chapters_dir.is_dir():
+        chapters_entry = top_level.get('chapters')
+        chapters_dir_exists = chapters_entry is not None and chapters_entry.is_dir()
+        if chapters_dir_exists:
+            # List chapter files (scandir entries know their type without a stat call)
+            with os.scandir(chapters_entry.path) as entries:
+                chapter_files = [
+                    entry.name for entry in entries
+                    if entry.is_file() and cls._CHAPTER_RE.match(entry.name)
+                ]
+            chapter_files.sort()
+
+        return cls._structure_report(
+            'metadata.json' in top_level,
+            'index.json' in top_level,
+            chapters_dir_exists,
+            chapter_files
+        )
+
+    @classmethod
+    def validate_archive_structure(cls, names: List[str], root_folder: str) -> Dict[str, any]:
+        """
+        Validate the book folder inside a ZIP archive without extracting it.
+
+        Args:
+            names: Member names of the archive (ZipFile.namelist())
+            root_folder: Book folder inside the archive ('' for a flat archive)
+
+        Returns:
+            Same report as validate_structure
+        """
+        prefix = f"{root_folder}/" if root_folder else ''
+        chapters_prefix = prefix + 'chapters/'
+        name_set = set(names)
+
+        # Directories are often implied by their members rather than stored as entries
+        chapters_dir_exists = False
+        chapter_files = set()
+        for name in name_set:
+            if not name.startswith(chapters_prefix):
+                continue
             chapters_dir_exists = True
+            filename = name[len(chapters_prefix):]
+            if cls._CHAPTER_RE.match(filename):
+                chapter_files.add(filename)
+
+        return cls._structure_report(
+            prefix + 'metadata.json' in name_set,
+            prefix + 'index.json' in name_set,
+            chapters_dir_exists,
+            sorted(chapter_files)
+        )
 
-            # List chapter files
-            import re
-            pattern = re.compile(r'^\d{3}\.md$')
-            for file in sorted(chapters_dir.iterdir()):
-                if file.is_file() and pattern.match(file.name):
-                    chapter_files.append(file.name)
+    @staticmethod
+    def _structure_report(
+        metadata_exists: bool,
+        index_exists: bool,
+        chapters_dir_exists: bool,
+        chapter_files: List[str]
+    ) -> Dict[str, any]:
+        """
+        Build the validation report shared by folder and archive validation.
+
+        Args:
+            metadata_exists: Whether metadata.json is present
+            index_exists: Whether index.json is present
+            chapters_dir_exists: Whether the chapters/ directory is present
+            chapter_files: Sorted chapter filenames found in chapters/
 
+        Returns:
+            Validation report (see validate_structure)
+        """
+        errors = []
+        warnings = []
+
+        if not metadata_exists:
+            warnings.append("metadata.json not found (will be generated)")
+
+        if not index_exists:
+            warnings.append("index.json not found (will be generated)")
+
+        if chapters_dir_exists:
             if not chapter_files:
                 errors.append("No chapter files found in chapters/ directory")
         else:
@@ -140,15 +201,10 @@ class FolderValidator:
         Returns:
             Metadata dict or None if not found/invalid
         """
-        metadata_path = folder_path / 'metadata.json'
-        if not metadata_path.exists():
-            return None
-
+        # A missing file surfaces as an IOError, so no separate exists() check
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            return metadata
-        except (json.JSONDecodeError, IOError) as e:
+            return orjson.loads((folder_path / 'metadata.json').read_bytes())
+        except (orjson.JSONDecodeError, IOError):
             return None
 
     @staticmethod
@@ -162,17 +218,51 @@ class FolderValidator:
         Returns:
             Index dict or None if not found/invalid
         """
-        index_path = folder_path / 'index.json'
-        if not index_path.exists():
+        # A missing file surfaces as an IOError, so no separate exists() check
+        try:
+            return orjson.loads((folder_path / 'index.json').read_bytes())
+        except (orjson.JSONDecodeError, IOError):
             return None
 
+    @staticmethod
+    def parse_archive_json(zf: zipfile.ZipFile, member: str) -> Optional[Dict]:
+        """
+        Parse a JSON file stored in a ZIP archive.
+
+        Args:
+            zf: Open ZIP archive
+            member: Member name inside the archive
+
+        Returns:
+            Parsed dict or None if not found/invalid
+        """
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                index = json.load(f)
-            return index
-        except (json.JSONDecodeError, IOError) as e:
+            return orjson.loads(zf.read(member))
+        except (KeyError, orjson.JSONDecodeError, OSError, zipfile.BadZipFile):
             return None
 
+    @staticmethod
+    def archive_folder(zf: zipfile.ZipFile) -> zipfile.Path:
+        """
+        Locate the book folder inside an open ZIP archive.
+
+        Args:
+            zf: Open ZIP archive
+
+        Returns:
+            Path to the book folder inside the archive
+
+        Raises:
+            ValueError: If ZIP is empty
+        """
+        all_names = zf.namelist()
+        if not all_names:
+            raise ValueError("ZIP file is empty")
+
+        # Root folder is the first component of the first entry, as in extract_zip
+        root_folder = all_names[0].split('/')[0] if '/' in all_names[0] else ''
+        return zipfile.Path(zf, at=f"{root_folder}/" if root_folder else '')
+
     @staticmethod
     def generate_metadata_from_folder(
         folder_path: Path,
@@ -245,13 +335,14 @@ class FolderValidator:
         return {'chapters': chapters}
 
     @classmethod
-    def validate_and_preview(cls, zip_content: bytes, temp_dir: Path) -> Dict[str, any]:
+    def validate_and_preview(cls, zip_content: bytes) -> Dict[str, any]:
         """
         Main validation and preview method for folder imports.
 
+        The archive is inspected in memory; nothing is extracted to disk.
+
         Args:
             zip_content: ZIP file bytes
-            temp_dir: Temporary directory for extraction
 
         Returns:
             Dict containing:
@@ -261,15 +352,16 @@ class FolderValidator:
                 - metadata: Dict - Extracted/generated metadata
                 - index: Dict - Extracted/generated index
                 - chapters_count: int
-                - folder_path: str - Path to extracted folder
+                - folder_path: str - Book folder inside the archive
         """
-        # Extract ZIP
         try:
-            folder_path = cls.extract_zip(zip_content, temp_dir)
-        except ValueError as e:
+            with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+                return cls._preview_archive(zf)
+        except (ValueError, zipfile.BadZipFile) as e:
+            message = str(e) if isinstance(e, ValueError) else "Invalid ZIP file"
             return {
                 'valid': False,
-                'errors': [str(e)],
+                'errors': [message],
                 'warnings': [],
                 'metadata': None,
                 'index': None,
@@ -277,8 +369,26 @@ class FolderValidator:
                 'folder_path': None
             }
 
+    @classmethod
+    def _preview_archive(cls, zf: zipfile.ZipFile) -> Dict[str, any]:
+        """
+        Validate and preview an open ZIP archive (see validate_and_preview).
+
+        Args:
+            zf: Open ZIP archive
+
+        Returns:
+            Validation and preview dict
+
+        Raises:
+            ValueError: If ZIP is empty
+        """
+        archive_path = cls.archive_folder(zf)
+        root_folder = archive_path.at.rstrip('/')
+        folder_path = Path(root_folder)
+
         # Validate structure
-        validation = cls.validate_structure(folder_path)
+        validation = cls.validate_archive_structure(zf.namelist(), root_folder)
 
         if not validation['valid']:
             return {
@@ -288,12 +398,16 @@ class FolderValidator:
                 'metadata': None,
                 'index': None,
                 'chapters_count': 0,
-                'folder_path': str(folder_path)
+                'folder_path': root_folder
             }
 
         # Parse existing metadata and index
-        existing_metadata = cls.parse_metadata(folder_path)
-        existing_index = cls.parse_index(folder_path)
+        existing_metadata = None
+        if validation['metadata_exists']:
+            existing_metadata = cls.parse_archive_json(zf, (archive_path / 'metadata.json').at)
+        existing_index = None
+        if validation['index_exists']:
+            existing_index = cls.parse_archive_json(zf, (archive_path / 'index.json').at)
 
         # Generate or use existing metadata
         metadata = cls.generate_metadata_from_folder(
@@ -316,17 +430,18 @@ class FolderValidator:
             'metadata': metadata,
             'index': index,
             'chapters_count': len(validation['chapter_files']),
-            'folder_path': str(folder_path),
+            'folder_path': root_folder,
             'chapter_files': validation['chapter_files']
         }
 
     @staticmethod
-    def read_chapter_content(folder_path: Path, chapter_filename: str) -> str:
+    def read_chapter_content(folder_path: Union[Path, zipfile.Path], chapter_filename: str) -> str:
         """
         Read chapter file content.
 
         Args:
-            folder_path: Path to book folder
+            folder_path: Path to book folder, on disk or inside an open ZIP
+                archive (see archive_folder)
             chapter_filename: Chapter filename (e.g., '000.md')
 
         Returns:
@@ -336,5 +451,30 @@ class FolderValidator:
             IOError: If file cannot be read
         """
         chapter_path = folder_path / 'chapters' / chapter_filename
-        with open(chapter_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return chapter_path.read_text(encoding='utf-8')
+
+    @classmethod
+    def read_all_chapters(
+        cls,
+        folder_path: Union[Path, zipfile.Path],
+        chapter_filenames: List[str]
+    ) -> List[str]:
+        """
+        Read several chapter files in one call.
+
+        Args:
+            folder_path: Path to book folder, on disk or inside an open ZIP
+                archive (see archive_folder)
+            chapter_filenames: Chapter filenames, in the order to return them
+
+        Returns:
+            Chapter contents, in the same order as chapter_filenames
+
+        Raises:
+            IOError: If a file cannot be read
+        """
+        chapters_dir = folder_path / 'chapters'
+        return [
+            (chapters_dir / filename).read_text(encoding='utf-8')
+            for filename in chapter_filenames
+        ]
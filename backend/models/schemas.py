@@ -1,10 +1,12 @@
 """
 Pydantic models for request/response validation and data structures.
 """
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+from typing import List, Literal, Optional, Dict, Any, Tuple
+from typing_extensions import Annotated, TypedDict
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 
 class ScrapeMode(str, Enum):
@@ -14,6 +16,33 @@ class ScrapeMode(str, Enum):
     HYBRID = "hybrid"
 
 
+# Model fields hold the mode as a plain string: pydantic-core checks a Literal
+# natively, whereas an Enum field calls the Enum constructor in Python. The
+# ScrapeMode members compare and hash equal to these strings.
+ScrapeModeName = Literal["one_page", "index_page", "hybrid"]
+
+
+# Tags are immutable tuples; the stored metadata interns each tag so books
+# sharing a tag ("fantasy", "romance") reference one string in the book index
+def _intern_tags(tags: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(map(sys.intern, tags))
+
+
+InternedTags = Annotated[Tuple[str, ...], AfterValidator(_intern_tags)]
+
+# Language codes repeat across every stored book, so they are interned the same way
+InternedLanguage = Annotated[str, AfterValidator(sys.intern)]
+
+
+# Response models are only built by the server from trusted data
+RESPONSE_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_default=False,
+    validate_assignment=False,
+    frozen=True
+)
+
+
 # Authentication Models
 class AuthRequest(BaseModel):
     """PIN authentication request."""
@@ -22,6 +51,8 @@ class AuthRequest(BaseModel):
 
 class AuthResponse(BaseModel):
     """Authentication response with JWT token."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     token: str
     expires_in: int = Field(default=86400, description="Token expiration in seconds")
@@ -33,11 +64,24 @@ class TokenVerifyRequest(BaseModel):
 
 
 # Scraper Models
+#
+# URL fields are deliberately plain str rather than HttpUrl: the scraper is the
+# only consumer, and requests/urllib reject malformed URLs when they are fetched,
+# so running pydantic's URL parser on every request would only add cost.
+class MetadataOverrides(BaseModel):
+    """User-provided metadata overrides for a scrape (only fields sent are applied)."""
+    title: Optional[str] = None
+    author: Optional[str] = None
+    language: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[Tuple[str, ...]] = None
+
+
 class ScrapeRequest(BaseModel):
     """Request to scrape a book page."""
     url: str = Field(..., description="URL to scrape")
-    mode: ScrapeMode = Field(default=ScrapeMode.ONE_PAGE, description="Scraping mode")
-    metadata_overrides: Optional[Dict[str, Any]] = Field(
+    mode: ScrapeModeName = Field(default=ScrapeMode.ONE_PAGE.value, description="Scraping mode")
+    metadata_overrides: Optional[MetadataOverrides] = Field(
         default=None,
         description="User-provided metadata overrides"
     )
@@ -55,6 +99,8 @@ class ScrapeRequest(BaseModel):
 
 class ScrapeProgress(BaseModel):
     """Scraping progress information."""
+    model_config = RESPONSE_CONFIG
+
     status: str = Field(..., description="Status: processing, completed, error")
     current_chapter: Optional[int] = None
     total_chapters: Optional[int] = None
@@ -65,7 +111,7 @@ class ScrapeProgress(BaseModel):
 class PreviewRequest(BaseModel):
     """Request to preview a page before scraping."""
     url: str = Field(..., description="URL to preview")
-    mode: ScrapeMode = Field(default=ScrapeMode.ONE_PAGE, description="Scraping mode")
+    mode: ScrapeModeName = Field(default=ScrapeMode.ONE_PAGE.value, description="Scraping mode")
     include_full_content: bool = Field(default=False, description="Include full content for editing")
     selected_containers: Optional[List[int]] = Field(default=None, description="Indices of containers to include (None = all)")
     chinese_mode: bool = Field(default=False, description="Use Chinese character detection for content extraction")
@@ -74,41 +120,49 @@ class PreviewRequest(BaseModel):
 
 class PreviewMetadata(BaseModel):
     """Metadata extracted from preview."""
+    model_config = RESPONSE_CONFIG
+
     title: Optional[str] = None
     author: Optional[str] = None
     language: str = "en"
     description: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = Field(default_factory=tuple)
 
 
-class ContentSizeInfo(BaseModel):
+# Preview payloads are assembled as dicts in app.py, so the small value types
+# inside them are TypedDicts too (no per-row model instance, same schema)
+class ContentSizeInfo(TypedDict):
     """Content size information."""
-    character_count: int = Field(..., description="Total character count")
-    estimated_bytes: int = Field(..., description="Estimated file size in bytes")
-    formatted_size: str = Field(..., description="Human-readable size (e.g., '1.5 MB')")
-    compression_estimate: Optional[str] = Field(None, description="Estimated compressed size")
+    character_count: Annotated[int, Field(description="Total character count")]
+    estimated_bytes: Annotated[int, Field(description="Estimated file size in bytes")]
+    formatted_size: Annotated[str, Field(description="Human-readable size (e.g., '1.5 MB')")]
+    compression_estimate: Annotated[Optional[str], Field(description="Estimated compressed size")]
 
 
-class ContainerInfo(BaseModel):
+class ContainerInfo(TypedDict):
     """Information about an HTML container used during extraction."""
-    type: str = Field(..., description="Container element type (div, section, article, main)")
-    id: Optional[str] = Field(None, description="Container ID attribute")
-    classes: Optional[str] = Field(None, description="Container CSS classes")
-    content_length: int = Field(..., description="Length of content from this container")
-    content_preview: str = Field(..., description="Preview of content from this container")
-    selected: bool = Field(default=True, description="Whether this container is selected for inclusion")
+    type: Annotated[str, Field(description="Container element type (div, section, article, main)")]
+    id: Annotated[Optional[str], Field(description="Container ID attribute")]
+    classes: Annotated[Optional[str], Field(description="Container CSS classes")]
+    content_length: Annotated[int, Field(description="Length of content from this container")]
+    content_preview: Annotated[str, Field(description="Preview of content from this container")]
+    selected: Annotated[bool, Field(description="Whether this container is selected for inclusion")]
 
 
-class ChapterLink(BaseModel):
+# Index pages and book indexes can hold thousands of rows, so these are plain
+# dicts validated by pydantic-core rather than model instances
+class ChapterLink(TypedDict):
     """Represents a chapter link found on an index page."""
-    name: str = Field(..., description="Chapter name/title")
-    url: str = Field(..., description="Chapter URL")
-    selected: bool = Field(default=True, description="Whether this chapter is selected for scraping")
-    order: int = Field(..., description="Sequential order (0-indexed)")
+    name: Annotated[str, Field(description="Chapter name/title")]
+    url: Annotated[str, Field(description="Chapter URL")]
+    selected: Annotated[bool, Field(description="Whether this chapter is selected for scraping")]
+    order: Annotated[int, Field(description="Sequential order (0-indexed)")]
 
 
 class IndexPagePreview(BaseModel):
     """Preview data specific to INDEX_PAGE and HYBRID modes."""
+    model_config = RESPONSE_CONFIG
+
     chapters: List[ChapterLink] = Field(default_factory=list)
     total_chapters_found: int = Field(default=0)
     index_content: Optional[str] = Field(None, description="Content from index page itself (for HYBRID mode)")
@@ -117,11 +171,14 @@ class IndexPagePreview(BaseModel):
 
 class PreviewResponse(BaseModel):
     """Response for preview request."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
-    mode: ScrapeMode
+    mode: ScrapeModeName
     content_preview: str = Field(..., description="First ~500 chars of content")
     full_length: int = Field(..., description="Full content length in characters")
     full_content: Optional[str] = Field(None, description="Full content for editing (only if requested)")
+    content_token: Optional[str] = Field(None, description="Token for streaming the full content from /api/scraper/preview/{token}/content")
     metadata: PreviewMetadata
     size_info: Optional[ContentSizeInfo] = Field(None, description="Content size information")
     containers: Optional[List[ContainerInfo]] = Field(None, description="HTML containers used during extraction")
@@ -134,6 +191,8 @@ class PreviewResponse(BaseModel):
 
 class ScrapeResponse(BaseModel):
     """Response after scraping completion."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     book_id: Optional[str] = None
     chapters_saved: int = 0
@@ -148,13 +207,15 @@ class CreateBookRequest(BaseModel):
     source_url: str = Field(..., description="Original source URL")
     author: Optional[str] = Field(None, description="Author name")
     language: str = Field(default="en", description="Content language code")
-    tags: List[str] = Field(default_factory=list, description="Book tags/categories")
+    tags: Tuple[str, ...] = Field(default_factory=tuple, description="Book tags/categories")
     description: Optional[str] = Field(None, description="Book description")
-    scrape_mode: ScrapeMode = Field(default=ScrapeMode.INDEX_PAGE, description="Scraping mode")
+    scrape_mode: ScrapeModeName = Field(default=ScrapeMode.INDEX_PAGE.value, description="Scraping mode")
 
 
 class CreateBookResponse(BaseModel):
     """Response after creating a book."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     book_id: Optional[str] = None
     message: Optional[str] = None
@@ -174,18 +235,48 @@ class AddChapterRequest(BaseModel):
 
 class AddChapterResponse(BaseModel):
     """Response after adding a chapter."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     chapter_id: Optional[int] = None
     message: Optional[str] = None
     error: Optional[str] = None
 
 
+class ChapterSpec(BaseModel):
+    """A single chapter within a batched add-chapters request."""
+    chapter_url: str = Field(..., description="URL of the chapter to scrape")
+    chapter_index: int = Field(..., description="Chapter index (0-based)")
+    chapter_name: str = Field(..., description="Chapter name/title")
+    custom_content: Optional[str] = Field(None, description="User-edited content (overrides scraped content)")
+    selected_containers: Optional[List[int]] = Field(None, description="Indices of containers to include (None = all)")
+    chinese_mode: bool = Field(default=False, description="Use Chinese character detection for content extraction")
+    simplify_markdown: bool = Field(default=False, description="Simplify markdown to only headings, paragraphs, and lists")
+
+
+class AddChaptersRequest(BaseModel):
+    """Request to add several chapters to an existing book at once."""
+    book_id: str = Field(..., description="Existing book ID")
+    chapters: List[ChapterSpec] = Field(..., description="Chapters to scrape and add")
+
+
+class AddChaptersResponse(BaseModel):
+    """Response after adding a batch of chapters."""
+    model_config = RESPONSE_CONFIG
+
+    success: bool
+    chapters_added: int = 0
+    results: List[AddChapterResponse] = Field(default_factory=list, description="Per-chapter status, in request order")
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+
 # Book Models
-class ChapterInfo(BaseModel):
-    """Chapter metadata information."""
-    id: int = Field(..., description="Chapter sequential ID")
-    title: str = Field(..., description="Chapter title")
-    file: str = Field(..., description="Filename (e.g., 000.md)")
+class ChapterInfo(TypedDict):
+    """Chapter metadata information (a plain dict, see ChapterLink)."""
+    id: Annotated[int, Field(description="Chapter sequential ID")]
+    title: Annotated[str, Field(description="Chapter title")]
+    file: Annotated[str, Field(description="Filename (e.g., 000.md)")]
 
 
 class BookMetadata(BaseModel):
@@ -193,13 +284,13 @@ class BookMetadata(BaseModel):
     id: str = Field(..., description="Unique book ID (UUID)")
     title: str = Field(..., description="Book title")
     author: Optional[str] = Field(None, description="Author name")
-    language: str = Field(default="en", description="Content language code")
+    language: InternedLanguage = Field(default="en", description="Content language code")
     encoding: str = Field(default="utf-8", description="Text encoding")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     chapters_count: int = Field(default=0, description="Total number of chapters")
-    tags: List[str] = Field(default_factory=list, description="Book tags/categories")
+    tags: InternedTags = Field(default_factory=tuple, description="Book tags/categories")
     source_url: str = Field(..., description="Original source URL")
-    scrape_mode: ScrapeMode = Field(default=ScrapeMode.ONE_PAGE)
+    scrape_mode: ScrapeModeName = Field(default=ScrapeMode.ONE_PAGE.value)
     description: Optional[str] = Field(None, description="Book description")
 
 
@@ -210,29 +301,37 @@ class BookIndex(BaseModel):
 
 class BookListItem(BaseModel):
     """Book item in list response."""
+    model_config = RESPONSE_CONFIG
+
     id: str
     title: str
     author: Optional[str]
     language: str
     chapters_count: int
     created_at: datetime
-    tags: List[str]
+    tags: Tuple[str, ...]
 
 
 class BookListResponse(BaseModel):
     """Response for book list endpoint."""
+    model_config = RESPONSE_CONFIG
+
     books: List[BookListItem]
     total: int
 
 
 class BookDetailResponse(BaseModel):
     """Detailed book information response."""
+    model_config = RESPONSE_CONFIG
+
     metadata: BookMetadata
     chapters: List[ChapterInfo]
 
 
 class ChapterContent(BaseModel):
     """Chapter content response."""
+    model_config = RESPONSE_CONFIG
+
     chapter_id: int
     title: str
     content: str
@@ -243,6 +342,8 @@ class ChapterContent(BaseModel):
 # Reading Progress Models (Phase 1 - basic implementation)
 class ReadingPosition(BaseModel):
     """Reading position for a book."""
+    model_config = ConfigDict(frozen=True)
+
     book_id: str
     chapter_id: int
     scroll_position: float = Field(default=0.0, ge=0.0, le=1.0)
@@ -252,6 +353,8 @@ class ReadingPosition(BaseModel):
 # Error Response
 class ErrorResponse(BaseModel):
     """Standard error response."""
+    model_config = RESPONSE_CONFIG
+
     error: str
     detail: Optional[str] = None
     status_code: int
@@ -260,6 +363,8 @@ class ErrorResponse(BaseModel):
 # Success Response
 class SuccessResponse(BaseModel):
     """Generic success response."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     message: str
 
@@ -267,6 +372,8 @@ class SuccessResponse(BaseModel):
 # Import Models
 class ImportFileResponse(BaseModel):
     """Response for file import preview/execution."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     book_id: Optional[str] = None
     message: str
@@ -275,6 +382,8 @@ class ImportFileResponse(BaseModel):
 
 class ValidateFolderResponse(BaseModel):
     """Response for folder validation/preview."""
+    model_config = RESPONSE_CONFIG
+
     valid: bool
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
@@ -286,6 +395,8 @@ class ValidateFolderResponse(BaseModel):
 
 class ImportFolderResponse(BaseModel):
     """Response for folder import execution."""
+    model_config = RESPONSE_CONFIG
+
     success: bool
     book_id: Optional[str] = None
     message: str
@@ -1,12 +1,21 @@
 """
 Web scraper module for extracting content from web pages.
 """
-from .modes import ScrapeMode, is_mode_supported, get_supported_modes
-from .extractor import ContentExtractor
+from .modes import ScrapeMode, MULTI_PAGE_MODES, is_mode_supported, get_supported_modes
 
 __all__ = [
     'ScrapeMode',
+    'MULTI_PAGE_MODES',
     'is_mode_supported',
     'get_supported_modes',
     'ContentExtractor'
 ]
+
+
+def __getattr__(name):
+    # ContentExtractor pulls in cloudscraper/requests, so load it on first use
+    # rather than whenever backend.scraper.modes is imported
+    if name == 'ContentExtractor':
+        from .extractor import ContentExtractor
+        return ContentExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,186 @@
 """
 Content extraction from web pages.
 """
+import logging
+import os
 import re
+import threading
+import time
 import requests
+from contextlib import contextmanager
+from functools import lru_cache
 import cloudscraper
-from typing import Dict, Optional, Tuple, List
-from bs4 import BeautifulSoup, Tag
+from requests.compat import chardet
+from typing import Callable, Dict, Optional, Tuple, List
+import lxml.html
+from lxml import etree
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+import soupsieve
 from langdetect import detect, LangDetectException
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+# Elements removed before content extraction
+CONTENT_STRIP_TAGS = frozenset(('script', 'style', 'nav', 'header', 'footer',
+                                'iframe', 'noscript', 'aside'))
+
+# Page bodies are read in chunks of this size so oversized pages are abandoned early
+FETCH_CHUNK_BYTES = 64 * 1024
+
+# Main content containers, tried in priority order (compiled once rather than
+# on every select_one call)
+CONTENT_CONTAINER_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'article', 'main', '[role="main"]',
+    '.content', '.post-content', '.article-content',
+    '#content', '#main', '.entry-content'
+))
+
+# Text cleanup: three or more line breaks (with blank space between), and space runs
+EXCESS_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n\s*\n+')
+SPACE_RUN_PATTERN = re.compile(r' {2,}')
+
+# String node types that get_text() collects from a container
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Elements considered as main content in Chinese mode
+CHINESE_CONTAINER_TAGS = frozenset(('div', 'section', 'article', 'main', 'p'))
+
+# Runs of CJK Unified Ideographs, Extension A and Extension B (same ranges as _is_chinese_char)
+CHINESE_CHAR_RUN_PATTERN = re.compile('[\u4e00-\u9fff\u3400-\u4dbf\U00020000-\U0002a6df]+')
+
+
+def _class_xpath(class_name: str) -> str:
+    """Build an XPath matching elements whose class list contains class_name (CSS '.class_name')."""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# XPath equivalents of the link-area CSS selectors, tried in priority order
+LINK_CONTAINER_XPATHS = [
+    '//article', '//main', '//*[@role="main"]',
+    _class_xpath('content'), _class_xpath('post-content'), _class_xpath('article-content'),
+    '//*[@id="content"]', '//*[@id="main"]', _class_xpath('entry-content'),
+    _class_xpath('chapter-list'), _class_xpath('toc'), _class_xpath('table-of-contents')
+]
+
+# Link texts containing any of these (lowercased, anywhere in the text) are
+# navigation rather than chapters
+LINK_SKIP_WORDS = (
+    'home', 'about', 'contact', 'login', 'register', 'search',
+    'privacy', 'terms', 'policy', 'rss', 'subscribe', 'follow',
+    'twitter', 'facebook', 'share', 'comment', 'next', 'previous',
+    'prev', 'download', 'print', 'bookmark', 'archive', 'latest',
+    'recent', 'popular', 'tag', 'category'
+)
+LINK_SKIP_PATTERN = re.compile('|'.join(LINK_SKIP_WORDS))
+
+# Stage 3 chapter-like link text: "chapter", "ch. 12", "12." / "12)" / "12:", "12".
+# One alternation with the shared prefixes factored out; it is matched against
+# the lowercased text, which leaves the number checks unaffected
+CHAPTER_LIKE_PATTERN = re.compile(r'\bch(?:apter\b|\.?\s*\d)|^\d+(?:[\.\):]|$)', re.I)
+
+# Separators between URL path tokens: hyphens, underscores, dots, whitespace
+URL_TOKEN_SEPARATOR_PATTERN = re.compile(r'[-_.\s]+')
+
+# Digit runs in a URL (the last one is usually the chapter number)
+DIGIT_RUN_PATTERN = re.compile(r'\d+')
+
+# Distinct language-detection samples remembered (each at most 1000 chars)
+LANGUAGE_DETECT_CACHE_SIZE = 1024
+
+# Tags extract_metadata reads by name, and the class tokens of its author
+# selectors; everything else is left out of the metadata parse
+METADATA_TAGS = frozenset(('title', 'meta', 'h1'))
+METADATA_AUTHOR_CLASSES = frozenset(('author', 'post-author'))
+
+# Stage 4 list items, in document order and each once however deeply the
+# lists nest: any <li> inside an <ol>, and any <li> inside a <ul> whose class
+# doesn't mention nav or menu (case-insensitively)
+_NAV_CLASS = "translate(@class, 'NAVMEU', 'navmeu')"
+ORDERED_LIST_ITEM_XPATH = './/ol//li'
+UNORDERED_LIST_ITEM_XPATH = (
+    f".//ul[not(contains({_NAV_CLASS}, 'nav') or contains({_NAV_CLASS}, 'menu'))]//li"
+)
+
+# Hrefs that never lead to another page (checked before resolving them)
+NON_PAGE_HREF_PREFIXES = ('#', 'mailto:', 'javascript:', 'tel:', 'data:')
+
+# Elements that might contain links but never hold chapter listings
+LINK_STRIP_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside')
+
+# Distinct URLs whose urlparse result is remembered
+URL_PARSE_CACHE_SIZE = 4096
+
+# Distinct URL path segments whose digit-stripped form is remembered
+URL_SEGMENT_CACHE_SIZE = 8192
+ASCII_DIGIT_RUN_PATTERN = re.compile('[0-9]+')
+
+
+@lru_cache(maxsize=LANGUAGE_DETECT_CACHE_SIZE)
+def _detect_language(sample: str) -> str:
+    """
+    langdetect.detect with results cached per sample.
+
+    A preview and the scrape that follows it detect the same sample, and
+    langdetect is randomised, so caching also keeps their answers consistent.
+    """
+    return detect(sample)
+
+
+@lru_cache(maxsize=URL_PARSE_CACHE_SIZE)
+def _parse_url(url: str):
+    """
+    urlparse with results cached per URL.
+
+    Chapter link detection looks at the same candidate URLs in several
+    passes; urlsplit caches itself but urlparse does not.
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=URL_SEGMENT_CACHE_SIZE)
+def _strip_digits(segment: str) -> str:
+    """
+    Remove every character str.isdigit() accepts, with results cached per segment.
+
+    ASCII segments (nearly all of them) go through a regex; other digits
+    such as superscripts are not matched by \\d, so those segments are
+    filtered character by character.
+    """
+    if segment.isascii():
+        return ASCII_DIGIT_RUN_PATTERN.sub('', segment)
+    return ''.join(c for c in segment if not c.isdigit())
 
 
 class ContentExtractor:
     """Extracts and cleans content from web pages."""
 
-    def __init__(self, timeout: int = 30, max_size_mb: int = 50):
+    def __init__(self, timeout: int = 30, max_size_mb: int = 50, max_connections: int = 50, page_cache=None, validator_cache=None, validator_max_page_kb: int = 1024):
         """
         Initialize the content extractor.
 
         Args:
             timeout: Request timeout in seconds
             max_size_mb: Maximum content size in megabytes
+            max_connections: Keep-alive connections pooled per host
+            page_cache: Optional cache (get/put by URL) of recently fetched HTML
+            validator_cache: Optional cache (get/put by URL) of (ETag,
+                Last-Modified, HTML) used to revalidate pages with conditional
+                requests once they have left page_cache
+            validator_max_page_kb: Only pages up to this size (in kilobytes)
+                are kept in validator_cache, bounding its memory use
         """
         self.timeout = timeout
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.max_connections = max_connections
+        self.page_cache = page_cache
+        self.validator_cache = validator_cache
+        self.validator_max_page_bytes = validator_max_page_kb * 1024
+
+        # One lock per URL being fetched, so concurrent callers share a single fetch
+        self._inflight_locks: Dict[str, threading.Lock] = {}
+        self._inflight_guard = threading.Lock()
 
         # More realistic browser headers to avoid anti-bot detection
         self.headers = {
@@ -51,16 +209,52 @@ class ContentExtractor:
             )
             self.session.headers.update(self.headers)
             self.using_cloudscraper = True
-            print("[ContentExtractor] Using cloudscraper for anti-bot bypass")
+            logger.info("[ContentExtractor] Using cloudscraper for anti-bot bypass")
         except Exception as e:
-            print(f"[ContentExtractor] Cloudscraper init failed, using regular requests: {e}")
+            logger.warning("[ContentExtractor] Cloudscraper init failed, using regular requests: %s", e)
             self.session = requests.Session()
             self.session.headers.update(self.headers)
             self.using_cloudscraper = False
 
+        self._configure_connection_pool()
+
+    def _configure_connection_pool(self):
+        """
+        Size the session's keep-alive pools so concurrent fetches to one host
+        reuse connections instead of discarding them.
+
+        The existing https adapter is resized in place rather than replaced,
+        since cloudscraper mounts its own cipher-suite adapter there.
+        """
+        for prefix in ('https://', 'http://'):
+            adapter = self.session.get_adapter(prefix)
+            adapter._pool_maxsize = self.max_connections
+            adapter.init_poolmanager(
+                adapter._pool_connections,
+                self.max_connections,
+                block=adapter._pool_block
+            )
+
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    @contextmanager
+    def _url_lock(self, url: str):
+        """Hold the per-URL fetch lock, creating it on first use."""
+        with self._inflight_guard:
+            lock = self._inflight_locks.setdefault(url, threading.Lock())
+        with lock:
+            try:
+                yield
+            finally:
+                with self._inflight_guard:
+                    if self._inflight_locks.get(url) is lock:
+                        del self._inflight_locks[url]
+
     def fetch_page(self, url: str, max_retries: int = 3) -> Tuple[Optional[str], Optional[str]]:
         """
-        Fetch HTML content from a URL with retry logic.
+        Fetch HTML content from a URL, served from the page cache when possible.
 
         Args:
             url: URL to fetch
@@ -69,54 +263,114 @@ class ContentExtractor:
         Returns:
             Tuple of (html_content, error_message)
         """
-        import time
-        from urllib.parse import urlparse
+        if self.page_cache is None:
+            return self._fetch_page_uncached(url, max_retries)
+
+        html = self.page_cache.get(url)
+        if html is not None:
+            return html, None
+
+        # Callers racing on the same URL (e.g. preview then execute) wait for one fetch
+        with self._url_lock(url):
+            html = self.page_cache.get(url)
+            if html is not None:
+                return html, None
+
+            html, error = self._fetch_page_uncached(url, max_retries)
+            if html is not None:
+                self.page_cache.put(url, html)
+            return html, error
+
+    def _fetch_page_uncached(self, url: str, max_retries: int = 3) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch HTML content from a URL with retry logic.
+
+        Args:
+            url: URL to fetch
+            max_retries: Maximum number of retry attempts (default: 3)
 
+        Returns:
+            Tuple of (html_content, error_message)
+        """
         last_error = None
 
+        # Revalidate a previously fetched copy: an unchanged page answers
+        # 304 Not Modified with no body
+        validators = self.validator_cache.get(url) if self.validator_cache is not None else None
+        conditional_headers = {}
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+
+        # Set Referer header to the domain root for better anti-bot evasion.
+        # The session merges its own headers in, so only the extras are passed.
+        domain = urlsplit(url)
+        retry_headers = {**conditional_headers, 'Referer': f"{domain.scheme}://{domain.netloc}/"}
+
         for attempt in range(max_retries):
             try:
                 # Add a small delay between retries to avoid rate limiting
                 if attempt > 0:
                     delay = 2 ** attempt  # Exponential backoff: 2, 4, 8 seconds
-                    print(f"Retry attempt {attempt + 1}/{max_retries} after {delay}s delay...")
+                    logger.debug("Retry attempt %d/%d after %ds delay...", attempt + 1, max_retries, delay)
                     time.sleep(delay)
 
-                # Set Referer header to the domain root for better anti-bot evasion
-                domain = urlparse(url)
-                referer = f"{domain.scheme}://{domain.netloc}/"
-
-                # Update session headers with Referer
-                request_headers = self.session.headers.copy()
-                if attempt > 0:
-                    # On retry, add Referer to make it look more natural
-                    request_headers['Referer'] = referer
-
                 response = self.session.get(
                     url,
-                    headers=request_headers,
+                    # On retry, add Referer to make it look more natural
+                    headers=retry_headers if attempt > 0 else (conditional_headers or None),
                     timeout=self.timeout,
                     stream=True,
                     allow_redirects=True
                 )
+                if validators and response.status_code == 304:
+                    response.close()
+                    return validators[2], None
                 response.raise_for_status()
 
                 # Check content size
                 content_length = response.headers.get('content-length')
                 if content_length and int(content_length) > self.max_size_bytes:
+                    response.close()
                     return None, f"Content too large: {int(content_length) / (1024*1024):.2f}MB"
 
-                # Get content with proper encoding detection
-                # Try to detect encoding from headers or content
-                if response.encoding == 'ISO-8859-1':
-                    # requests defaults to ISO-8859-1 if no charset specified
-                    # Try to detect from content
-                    response.encoding = response.apparent_encoding
+                # Read the body in chunks, giving up as soon as it passes the limit
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=FETCH_CHUNK_BYTES):
+                    received += len(chunk)
+                    if received > self.max_size_bytes:
+                        response.close()
+                        return None, "Content exceeds size limit"
+                    chunks.append(chunk)
+                raw = b''.join(chunks)
 
-                content = response.text
+                # Get content with proper encoding detection
+                # requests defaults to ISO-8859-1 if no charset specified, so
+                # detect from the content instead (as response.apparent_encoding)
+                encoding = response.encoding
+                if encoding is None or encoding == 'ISO-8859-1':
+                    encoding = chardet.detect(raw)['encoding'] if chardet is not None else 'utf-8'
 
-                if len(content.encode('utf-8')) > self.max_size_bytes:
-                    return None, "Content exceeds size limit"
+                # Decode once, the same way response.text would
+                try:
+                    content = str(raw, encoding, errors='replace')
+                except (LookupError, TypeError):
+                    content = str(raw, errors='replace')
+
+                # Remember the validators for the next fetch of this URL
+                # (large pages are not kept, so the cache stays small)
+                if self.validator_cache is not None:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if (etag or last_modified) and received <= self.validator_max_page_bytes:
+                        self.validator_cache.put(url, (etag, last_modified, content))
+                    elif validators:
+                        # The cached copy is outdated
+                        self.validator_cache.pop(url)
 
                 return content, None
 
@@ -152,50 +406,84 @@ class ContentExtractor:
             Tuple of (extracted_text, containers_list)
             containers_list is None if track_containers is False
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self._extract_content_from_soup(self._parse(html), track_containers, chinese_mode, simplify_markdown)
 
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer',
-                            'iframe', 'noscript', 'aside']):
+    def _parse(self, html: str) -> BeautifulSoup:
+        """Parse HTML with the lxml backend."""
+        return BeautifulSoup(html, 'lxml')
+
+    def _strip_unwanted(self, soup: BeautifulSoup):
+        """
+        Remove elements that never hold page content (safe to repeat on one soup).
+
+        The tree is walked directly rather than through find_all(), whose
+        per-tag matcher dominated extraction time, and removed subtrees are
+        not searched.
+        """
+        unwanted = []
+        pending = [soup]
+        while pending:
+            for child in pending.pop().contents:
+                if isinstance(child, Tag):
+                    if child.name in CONTENT_STRIP_TAGS:
+                        unwanted.append(child)
+                    else:
+                        pending.append(child)
+
+        for element in unwanted:
             element.decompose()
 
+    def _extract_content_from_soup(self, soup: BeautifulSoup, track_containers: bool = False, chinese_mode: bool = False, simplify_markdown: bool = False) -> Tuple[str, Optional[List[Dict]]]:
+        """
+        Extract main text content from an already-parsed page.
+
+        The soup is modified (unwanted elements are removed), so extract
+        metadata from it first.
+
+        Args:
+            soup: Parsed page
+            track_containers: Whether to track container information
+            chinese_mode: Use Chinese character detection for content extraction
+            simplify_markdown: Simplify markdown to only headings, paragraphs, and lists
+
+        Returns:
+            Tuple of (extracted_text, containers_list)
+        """
+        # Remove unwanted elements
+        self._strip_unwanted(soup)
+
         # Chinese mode: find containers with Chinese content
         if chinese_mode:
             body_element = soup.find('body') or soup
 
-            # Find all potential content containers
-            potential_containers = body_element.find_all(['div', 'section', 'article', 'main', 'p'])
+            # Text statistics for every element in one bottom-up pass, so
+            # nested containers don't each re-walk their whole subtree; the
+            # same walk collects the potential content containers
+            text_stats = {}
+            potential_containers = []
+            self._collect_text_stats(body_element, text_stats, potential_containers)
 
+            # (content length, element, Chinese share) of each candidate; the
+            # container info dicts are only built when tracking is requested
             chinese_containers = []
             for container in potential_containers:
-                # Get text content
-                container_text = container.get_text(strip=True)
+                text_length, visible_chars, chinese_chars = text_stats[id(container)]
 
                 # Skip empty or very short containers
-                if not container_text or len(container_text) < 50:
+                if text_length < 50:
                     continue
 
                 # Check if majority Chinese
-                chinese_percentage = self._calculate_chinese_percentage(container_text)
+                chinese_percentage = chinese_chars / visible_chars if visible_chars else 0.0
                 if chinese_percentage > 0.5:
-                    # Track this container
-                    chinese_containers.append({
-                        'element': container,
-                        'type': container.name,
-                        'id': container.get('id'),
-                        'classes': ' '.join(container.get('class', [])) or None,
-                        'content_length': len(container_text),
-                        'content_preview': container_text[:200] + ('...' if len(container_text) > 200 else ''),
-                        'selected': True,
-                        'chinese_percentage': round(chinese_percentage * 100, 1)
-                    })
+                    chinese_containers.append((text_length, container, chinese_percentage))
 
             # Sort by content length (largest first)
-            chinese_containers.sort(key=lambda x: x['content_length'], reverse=True)
+            chinese_containers.sort(key=lambda c: c[0], reverse=True)
 
             # Use the largest Chinese container as main content
             if chinese_containers:
-                main_content = chinese_containers[0]['element']
+                main_content = chinese_containers[0][1]
             else:
                 # No Chinese content found, fallback to body
                 main_content = body_element
@@ -209,14 +497,21 @@ class ContentExtractor:
                 text = self._simplify_markdown(text)
 
             # Prepare container tracking if requested
-            if track_containers and chinese_containers:
-                # Return container info without the 'element' key
+            if track_containers:
                 containers_tracker = [
-                    {k: v for k, v in c.items() if k != 'element'}
-                    for c in chinese_containers
+                    {
+                        'type': container.name,
+                        'id': container.get('id'),
+                        'classes': ' '.join(container.get('class', [])) or None,
+                        'content_length': text_length,
+                        'content_preview': self._text_prefix(container, 200) + ('...' if text_length > 200 else ''),
+                        'selected': True,
+                        'chinese_percentage': round(chinese_percentage * 100, 1)
+                    }
+                    for text_length, container, chinese_percentage in chinese_containers
                 ]
             else:
-                containers_tracker = [] if track_containers else None
+                containers_tracker = None
 
             return text, containers_tracker
 
@@ -224,10 +519,8 @@ class ContentExtractor:
         main_content = None
 
         # Look for common content containers
-        for selector in ['article', 'main', '[role="main"]',
-                        '.content', '.post-content', '.article-content',
-                        '#content', '#main', '.entry-content']:
-            main_content = soup.select_one(selector)
+        for selector in CONTENT_CONTAINER_SELECTORS:
+            main_content = selector.select_one(soup)
             if main_content:
                 break
 
@@ -238,8 +531,9 @@ class ContentExtractor:
         if not main_content:
             main_content = soup
 
-        # Initialize container tracking if requested
-        containers_tracker = [] if track_containers else None
+        # Initialize container tracking if requested (keyed by type/id/classes
+        # so repeated containers are dropped with a single lookup)
+        containers_tracker = {} if track_containers else None
 
         # Extract text with better formatting
         text = self._extract_text_with_structure(main_content, containers_tracker)
@@ -251,37 +545,97 @@ class ContentExtractor:
         if simplify_markdown:
             text = self._simplify_markdown(text)
 
+        if containers_tracker is not None:
+            containers_tracker = list(containers_tracker.values())
+
         return text, containers_tracker
 
+    def _collect_text_stats(self, element, stats: Dict[int, Tuple[int, int, int]], containers: List) -> Tuple[int, int, int]:
+        """
+        Compute get_text(strip=True) statistics for element and its descendants.
+
+        Args:
+            element: BeautifulSoup element
+            stats: Filled with id(tag) -> (text length, non-whitespace
+                characters, Chinese characters) for every tag visited
+            containers: Descendant tags named in CHINESE_CONTAINER_TAGS are
+                appended here in document order (as find_all would return them)
+
+        Returns:
+            Statistics for element
+        """
+        text_length = visible_chars = chinese_chars = 0
+        for child in element.children:
+            if isinstance(child, Tag):
+                if child.name in CHINESE_CONTAINER_TAGS:
+                    containers.append(child)
+                child_length, child_visible, child_chinese = self._collect_text_stats(child, stats, containers)
+                text_length += child_length
+                visible_chars += child_visible
+                chinese_chars += child_chinese
+            # Same string types get_text() includes (no comments, ruby text...)
+            elif type(child) in TEXT_STRING_TYPES:
+                piece = child.strip()
+                if piece:
+                    text_length += len(piece)
+                    visible_chars += len(''.join(piece.split()))
+                    chinese_chars += sum(map(len, CHINESE_CHAR_RUN_PATTERN.findall(piece)))
+
+        result = (text_length, visible_chars, chinese_chars)
+        stats[id(element)] = result
+        return result
+
+    def _text_prefix(self, element, limit: int) -> str:
+        """
+        Get the first characters of element.get_text(strip=True) without
+        building the whole text.
+
+        Args:
+            element: BeautifulSoup element
+            limit: Number of characters wanted
+
+        Returns:
+            Text prefix of at most limit characters
+        """
+        parts = []
+        collected = 0
+        for piece in element.stripped_strings:
+            parts.append(piece)
+            collected += len(piece)
+            if collected >= limit:
+                break
+        return ''.join(parts)[:limit]
+
     def _extract_text_with_structure(self, element, containers_tracker=None) -> str:
         """
         Extract text while preserving paragraph structure and converting to markdown.
 
         Args:
             element: BeautifulSoup element
-            containers_tracker: Optional list to track container information
+            containers_tracker: Optional dict collecting container information
 
         Returns:
             Formatted markdown text
         """
-        return self._process_element(element, [], containers_tracker)
+        return self._process_element(element, set(), containers_tracker)
 
-    def _process_element(self, element, processed_elements, containers_tracker=None) -> str:
+    def _process_element(self, element, processed_ids, containers_tracker=None) -> str:
         """
         Recursively process element and its children to extract structured text.
 
         Args:
             element: BeautifulSoup element
-            processed_elements: List of already processed elements to avoid duplicates
-            containers_tracker: Optional list to track container information
+            processed_ids: Set of id()s of already processed elements to avoid duplicates
+            containers_tracker: Optional dict collecting container information
 
         Returns:
             Formatted text
         """
-        if element in processed_elements:
+        element_id = id(element)
+        if element_id in processed_ids:
             return ""
 
-        processed_elements.append(element)
+        processed_ids.add(element_id)
         result = []
 
         # Handle different element types
@@ -355,12 +709,13 @@ class ContentExtractor:
 
             # Divs and other containers - process children
             elif element.name in ['div', 'section', 'article', 'main']:
-                # Track container if tracking is enabled
-                container_start_pos = len(''.join(result))
+                # Track container if tracking is enabled (its text starts at
+                # this list index, no need to join what came before)
+                container_start_idx = len(result)
 
                 for child in element.children:
                     if isinstance(child, Tag):
-                        result.append(self._process_element(child, processed_elements, containers_tracker))
+                        result.append(self._process_element(child, processed_ids, containers_tracker))
                     elif child.string and child.string.strip():
                         # Handle text nodes
                         text = child.string.strip()
@@ -369,30 +724,27 @@ class ContentExtractor:
 
                 # Record container info if tracking enabled and container has content
                 if containers_tracker is not None:
-                    container_text = ''.join(result[container_start_pos:] if result else [])
+                    container_text = ''.join(result[container_start_idx:])
                     if container_text.strip():
                         # Build container identifier
                         container_id = element.get('id', '')
                         container_classes = ' '.join(element.get('class', []))
 
-                        container_info = {
-                            'type': element.name,
-                            'id': container_id if container_id else None,
-                            'classes': container_classes if container_classes else None,
-                            'content_length': len(container_text),
-                            'content_preview': container_text[:100].strip() + '...' if len(container_text) > 100 else container_text.strip()
-                        }
-
-                        # Check if this container is unique (not already tracked)
-                        is_duplicate = any(
-                            c['type'] == container_info['type'] and
-                            c['id'] == container_info['id'] and
-                            c['classes'] == container_info['classes']
-                            for c in containers_tracker
+                        container_key = (
+                            element.name,
+                            container_id if container_id else None,
+                            container_classes if container_classes else None
                         )
 
-                        if not is_duplicate:
-                            containers_tracker.append(container_info)
+                        # Only the first container with this identity is tracked
+                        if container_key not in containers_tracker:
+                            containers_tracker[container_key] = {
+                                'type': container_key[0],
+                                'id': container_key[1],
+                                'classes': container_key[2],
+                                'content_length': len(container_text),
+                                'content_preview': container_text[:100].strip() + '...' if len(container_text) > 100 else container_text.strip()
+                            }
 
             # Tables (simple conversion)
             elif element.name == 'table':
@@ -417,8 +769,8 @@ class ContentExtractor:
             # For other elements, just get their text if they don't have children
             else:
                 # Only process if it's a leaf node or doesn't contain block elements
-                children_tags = element.find_all(recursive=False)
-                if not children_tags:
+                # (a direct scan of the children, without find_all's matcher setup)
+                if not any(isinstance(child, Tag) for child in element.children):
                     text = element.get_text(strip=True)
                     if text:
                         result.append(text + ' ')
@@ -467,7 +819,8 @@ class ContentExtractor:
         if not text_no_whitespace:
             return 0.0
 
-        chinese_count = sum(1 for char in text_no_whitespace if self._is_chinese_char(char))
+        # Count in C by matching whole runs of Chinese characters
+        chinese_count = sum(map(len, CHINESE_CHAR_RUN_PATTERN.findall(text_no_whitespace)))
         return chinese_count / len(text_no_whitespace)
 
     def _is_majority_chinese(self, text: str) -> bool:
@@ -492,13 +845,12 @@ class ContentExtractor:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        # Remove excessive whitespace (single spaces are left alone)
+        text = EXCESS_BLANK_LINES_PATTERN.sub('\n\n', text)
+        text = SPACE_RUN_PATTERN.sub(' ', text)
 
         # Remove leading/trailing whitespace from lines
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        text = '\n'.join(map(str.strip, text.split('\n')))
 
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -581,7 +933,7 @@ class ContentExtractor:
         text = '\n'.join(cleaned_lines)
 
         # Clean up excessive blank lines created by removals
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = EXCESS_BLANK_LINES_PATTERN.sub('\n\n', text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -599,8 +951,43 @@ class ContentExtractor:
         Returns:
             Dictionary with metadata fields
         """
-        soup = BeautifulSoup(html, 'lxml')
+        # Only build the tags metadata is read from (plus their subtrees).
+        # <html> itself can't be kept without keeping the whole document, so
+        # its attributes are captured as it goes past.
+        html_attrs = {}
+
+        def keep_tag(name, attrs):
+            if name == 'html':
+                html_attrs.update(attrs)
+                return False
+            if name in METADATA_TAGS or 'rel' in attrs:
+                return True
+            return not METADATA_AUTHOR_CLASSES.isdisjoint(attrs.get('class', '').split())
+
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(keep_tag))
+
+        return self._extract_metadata_from_soup(
+            soup,
+            url,
+            lambda: self.extract_content(html, track_containers=False)[0],
+            html_lang=html_attrs.get('lang')
+        )
+
+    def _extract_metadata_from_soup(self, soup: BeautifulSoup, url: str, text_sample: Callable[[], str], html_lang: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Extract metadata from an already-parsed page.
 
+        Args:
+            soup: Parsed page (not yet stripped of unwanted elements)
+            url: Source URL
+            text_sample: Returns page text for language detection; only called
+                when the page declares no language
+            html_lang: lang attribute of <html>, for soups parsed without it
+                (otherwise read from the soup)
+
+        Returns:
+            Dictionary with metadata fields
+        """
         metadata = {
             'title': None,
             'author': None,
@@ -653,9 +1040,11 @@ class ContentExtractor:
 
         # Detect language
         # Priority: html lang attribute > meta tag > content detection
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            metadata['language'] = html_tag['lang'].split('-')[0]
+        if html_lang is None:
+            html_tag = soup.find('html')
+            html_lang = html_tag.get('lang') if html_tag else None
+        if html_lang:
+            metadata['language'] = html_lang.split('-')[0]
         else:
             lang_meta = soup.find('meta', {'http-equiv': 'content-language'}) or \
                        soup.find('meta', {'name': 'language'})
@@ -664,9 +1053,9 @@ class ContentExtractor:
             else:
                 # Try to detect from content
                 try:
-                    text_sample, _ = self.extract_content(html, track_containers=False)
-                    if text_sample:
-                        detected_lang = detect(text_sample[:1000])
+                    sample = text_sample()
+                    if sample:
+                        detected_lang = _detect_language(sample[:1000])
                         metadata['language'] = detected_lang
                 except LangDetectException:
                     pass  # Keep default 'en'
@@ -696,12 +1085,22 @@ class ContentExtractor:
         Returns:
             Extracted text from selected containers
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self._extract_selected_from_soup(self._parse(html), containers, selected_indices)
+
+    def _extract_selected_from_soup(self, soup: BeautifulSoup, containers: List[Dict], selected_indices: List[int]) -> str:
+        """
+        Extract content from the selected containers of an already-parsed page.
+
+        Args:
+            soup: Parsed page
+            containers: List of container info from initial extraction
+            selected_indices: Indices of containers to include
 
+        Returns:
+            Extracted text from selected containers
+        """
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer',
-                            'iframe', 'noscript', 'aside']):
-            element.decompose()
+        self._strip_unwanted(soup)
 
         # Collect selected container identifiers
         selected_containers = []
@@ -712,29 +1111,21 @@ class ContentExtractor:
         if not selected_containers:
             return ""
 
-        # Find and extract content from matching containers
-        extracted_parts = []
-        for container_info in selected_containers:
-            # Find the container element in the soup
-            container_type = container_info['type']
-            container_id = container_info.get('id')
-            container_classes = container_info.get('classes')
-
-            # Build selector
-            if container_id:
-                # Find by ID (most specific)
-                elements = soup.find_all(container_type, id=container_id)
-            elif container_classes:
-                # Find by classes
-                class_list = container_classes.split()
-                elements = soup.find_all(container_type, class_=lambda x: x and all(c in x for c in class_list))
-            else:
-                # Find by type only (less specific, may match multiple)
-                elements = soup.find_all(container_type)
+        # Find the matching elements of every selected container in one pass
+        # over the tree (each container keeps its matches in document order)
+        matches = [[] for _ in selected_containers]
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            for container_info, container_matches in zip(selected_containers, matches):
+                if self._matches_container(element, container_info):
+                    container_matches.append(element)
 
-            # Extract content from found elements
+        # Extract content from found elements, container by container
+        extracted_parts = []
+        for elements in matches:
             for element in elements:
-                text = self._process_element(element, [], None)
+                text = self._process_element(element, set(), None)
                 if text.strip():
                     extracted_parts.append(text)
 
@@ -742,6 +1133,34 @@ class ContentExtractor:
         combined = '\n\n'.join(extracted_parts)
         return self._clean_text(combined)
 
+    def _matches_container(self, element: Tag, container_info: Dict) -> bool:
+        """
+        Check whether an element belongs to a tracked container.
+
+        Args:
+            element: BeautifulSoup tag
+            container_info: Container info from initial extraction
+
+        Returns:
+            True if the element has the container's type and its id (most
+            specific) or, failing that, its classes; type alone otherwise
+        """
+        if element.name != container_info['type']:
+            return False
+
+        container_id = container_info.get('id')
+        if container_id:
+            return element.get('id') == container_id
+
+        container_classes = container_info.get('classes')
+        if container_classes:
+            # Each class name only has to occur somewhere in the element's
+            # class attribute (substring match, as find_all's class_ filter did)
+            element_classes = ' '.join(element.get('class') or [])
+            return bool(element_classes) and all(c in element_classes for c in container_classes.split())
+
+        return True
+
     def scrape_page(self, url: str, track_containers: bool = False, selected_containers: Optional[List[int]] = None, chinese_mode: bool = False, simplify_markdown: bool = False) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Scrape a single page and extract content and metadata.
@@ -763,21 +1182,28 @@ class ContentExtractor:
             return None, error
 
         try:
+            # Parse once. Metadata reads elements that content extraction
+            # strips (header, nav...), so it goes first; both later passes
+            # share the stripped tree.
+            soup = self._parse(html)
+            metadata = self._extract_metadata_from_soup(
+                soup,
+                url,
+                lambda: self._extract_content_from_soup(soup)[0]
+            )
+
             # Extract content
-            content, containers = self.extract_content(html, track_containers, chinese_mode, simplify_markdown)
+            content, containers = self._extract_content_from_soup(soup, track_containers, chinese_mode, simplify_markdown)
 
             if not content:
                 return None, "No content found on page"
 
             # If selected_containers is provided, re-extract with only those containers
             if selected_containers is not None and track_containers and containers:
-                content = self.extract_content_from_selected_containers(html, containers, selected_containers)
+                content = self._extract_selected_from_soup(soup, containers, selected_containers)
                 if not content:
                     return None, "No content found in selected containers"
 
-            # Extract metadata
-            metadata = self.extract_metadata(html, url)
-
             result = {
                 'content': content,
                 'metadata': metadata
@@ -803,71 +1229,64 @@ class ContentExtractor:
         Returns:
             List of dictionaries with 'name' and 'url' keys
         """
-        soup = BeautifulSoup(html, 'lxml')
+        # Scan tags on the bare lxml tree: the link walk needs no BeautifulSoup wrappers
+        tree = self._parse_link_document(html)
+        if tree is None:
+            return []
 
         # Remove unwanted elements that might contain links
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            element.decompose()
+        etree.strip_elements(tree, *LINK_STRIP_TAGS, with_tail=False)
 
         # Try to find main content area
         main_content = None
-        for selector in ['article', 'main', '[role="main"]',
-                        '.content', '.post-content', '.article-content',
-                        '#content', '#main', '.entry-content',
-                        '.chapter-list', '.toc', '.table-of-contents']:
-            main_content = soup.select_one(selector)
-            if main_content:
+        for xpath in LINK_CONTAINER_XPATHS:
+            matches = tree.xpath(xpath)
+            if matches:
+                main_content = matches[0]
                 break
 
         # If no main content found, use body
-        if not main_content:
-            main_content = soup.find('body')
+        if main_content is None:
+            main_content = tree.find('body')
 
-        if not main_content:
-            main_content = soup
+        if main_content is None:
+            main_content = tree
 
         # Find all links
-        all_links = main_content.find_all('a', href=True)
+        all_links = main_content.xpath('.//a[@href]')
 
-        # Parse base URL to filter out external links
-        base_domain = urlparse(base_url).netloc
+        # Parse base URL to filter out external links (only the netloc is
+        # compared, so urlsplit is enough)
+        base_domain = urlsplit(base_url).netloc
 
         # Stage 1: Extract and filter candidate links
         candidate_links = []
         seen_urls = set()
 
         for link in all_links:
-            href = link.get('href', '').strip()
-            if not href or href.startswith('#'):
+            href = link.get('href').strip()
+            if not href or href.startswith(NON_PAGE_HREF_PREFIXES):
                 continue
 
             # Convert relative URLs to absolute
             full_url = urljoin(base_url, href)
 
-            # Skip external links (different domain)
-            link_domain = urlparse(full_url).netloc
-            if link_domain != base_domain:
+            # Skip duplicates (a set lookup, so before parsing the URL)
+            if full_url in seen_urls:
                 continue
 
-            # Skip duplicates
-            if full_url in seen_urls:
+            # Skip external links (different domain; the parse is cached for
+            # the URL clustering in Stage 2)
+            if _parse_url(full_url).netloc != base_domain:
                 continue
 
             # Get link text
-            link_text = link.get_text(strip=True)
+            link_text = self._element_text(link)
             if not link_text:
                 continue
 
             # Filter out common navigation links (expanded blacklist)
-            lower_text = link_text.lower()
-            skip_patterns = [
-                'home', 'about', 'contact', 'login', 'register', 'search',
-                'privacy', 'terms', 'policy', 'rss', 'subscribe', 'follow',
-                'twitter', 'facebook', 'share', 'comment', 'next', 'previous',
-                'prev', 'download', 'print', 'bookmark', 'archive', 'latest',
-                'recent', 'popular', 'tag', 'category'
-            ]
-            if any(pattern in lower_text for pattern in skip_patterns):
+            if LINK_SKIP_PATTERN.search(link_text.lower()):
                 continue
 
             candidate_links.append({
@@ -877,122 +1296,155 @@ class ContentExtractor:
             seen_urls.add(full_url)
 
         # Debug: Log candidate links found
-        print(f"[Stage 1] Found {len(candidate_links)} candidate links after filtering")
-        if candidate_links and len(candidate_links) <= 10:
-            print(f"[Stage 1] Sample links: {[link['name'][:50] for link in candidate_links[:5]]}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[Stage 1] Found %d candidate links after filtering", len(candidate_links))
+            if candidate_links and len(candidate_links) <= 10:
+                logger.debug("[Stage 1] Sample links: %s", [link['name'][:50] for link in candidate_links[:5]])
 
         # Stage 2: Try URL pattern analysis (NEW)
         if len(candidate_links) >= 2:
             # Cluster similar URLs with 90%+ similarity threshold
             url_clusters = self._cluster_similar_urls(candidate_links, threshold=0.9)
 
-            print(f"[Stage 2] Found {len(url_clusters)} URL clusters")
+            logger.debug("[Stage 2] Found %d URL clusters", len(url_clusters))
             if url_clusters:
                 largest_cluster = url_clusters[0]
-                print(f"[Stage 2] Largest cluster has {len(largest_cluster)} links")
+                logger.debug("[Stage 2] Largest cluster has %d links", len(largest_cluster))
 
                 # Check if cluster has sequential pattern
                 pattern_info = self._detect_sequential_pattern(largest_cluster)
 
                 if pattern_info:
-                    print(f"[Stage 2] Pattern confidence: {pattern_info['confidence']:.2f}, threshold: 0.8")
+                    logger.debug("[Stage 2] Pattern confidence: %.2f, threshold: 0.8", pattern_info['confidence'])
 
                     if pattern_info['confidence'] > 0.8:
                         # Found strong URL pattern - return these links
-                        print(f"[URL Pattern] ✓ Found {len(largest_cluster)} chapter links with {pattern_info['confidence']:.2f} confidence")
-                        print(f"[URL Pattern] Range: {pattern_info['min']}-{pattern_info['max']}, Gaps: {pattern_info['gaps']}")
+                        if debug:
+                            logger.debug("[URL Pattern] ✓ Found %d chapter links with %.2f confidence", len(largest_cluster), pattern_info['confidence'])
+                            logger.debug("[URL Pattern] Range: %d-%d, Gaps: %d", pattern_info['min'], pattern_info['max'], pattern_info['gaps'])
                         return largest_cluster
                     else:
-                        print(f"[Stage 2] Confidence too low ({pattern_info['confidence']:.2f} < 0.8), falling back")
+                        logger.debug("[Stage 2] Confidence too low (%.2f < 0.8), falling back", pattern_info['confidence'])
                 else:
-                    print(f"[Stage 2] No sequential pattern detected in cluster")
+                    logger.debug("[Stage 2] No sequential pattern detected in cluster")
             else:
-                print(f"[Stage 2] No clusters found with 90%+ similarity")
+                logger.debug("[Stage 2] No clusters found with 90%%+ similarity")
         else:
-            print(f"[Stage 2] Skipped (need at least 2 candidates, have {len(candidate_links)})")
+            logger.debug("[Stage 2] Skipped (need at least 2 candidates, have %d)", len(candidate_links))
 
         # Stage 3: Fallback to text-based heuristics
-        print("[Stage 3] No strong URL pattern found, falling back to text-based detection")
+        logger.debug("[Stage 3] No strong URL pattern found, falling back to text-based detection")
         chapter_links = []
 
         for link_dict in candidate_links:
-            link_text = link_dict['name']
-            lower_text = link_text.lower()
-
             # More strict text-based check (removed overly permissive length filter)
-            is_chapter_like = (
-                re.search(r'\bchapter\b', lower_text, re.I) or
-                re.search(r'\bch\.?\s*\d+', lower_text, re.I) or
-                re.search(r'^\d+[\.\):]', link_text) or  # Starts with number
-                re.search(r'^\d+$', link_text)  # Just a number
-            )
-
-            if is_chapter_like:
+            if CHAPTER_LIKE_PATTERN.search(link_dict['name'].lower()):
                 chapter_links.append(link_dict)
 
-        print(f"[Stage 3] Text-based detection found {len(chapter_links)} chapter-like links")
+        logger.debug("[Stage 3] Text-based detection found %d chapter-like links", len(chapter_links))
 
         # If we found very few links with the strict criteria, try list-based fallback
         if len(chapter_links) < 3:
-            print(f"[Stage 4] Only {len(chapter_links)} links found, trying list-based fallback")
+            logger.debug("[Stage 4] Only %d links found, trying list-based fallback", len(chapter_links))
             chapter_links = []
             seen_urls = set()
 
             # Look for links in ordered lists (common for chapter listings)
-            for ol in main_content.find_all('ol'):
-                for li in ol.find_all('li'):
-                    link = li.find('a', href=True)
-                    if link:
-                        href = link.get('href', '').strip()
-                        if href and not href.startswith('#'):
+            for li in main_content.xpath(ORDERED_LIST_ITEM_XPATH):
+                link = self._first_link(li)
+                if link is not None:
+                    href = link.get('href').strip()
+                    if href and not href.startswith(NON_PAGE_HREF_PREFIXES):
+                        full_url = urljoin(base_url, href)
+                        if full_url not in seen_urls:
+                            link_text = self._element_text(link)
+                            if link_text:
+                                chapter_links.append({
+                                    'name': link_text,
+                                    'url': full_url
+                                })
+                                seen_urls.add(full_url)
+
+            # If still not enough, look for links in unordered lists
+            # (skipping those that look like navigation menus)
+            if len(chapter_links) < 3:
+                for li in main_content.xpath(UNORDERED_LIST_ITEM_XPATH):
+                    link = self._first_link(li)
+                    if link is not None:
+                        href = link.get('href').strip()
+                        if href and not href.startswith(NON_PAGE_HREF_PREFIXES):
                             full_url = urljoin(base_url, href)
-                            if full_url not in seen_urls:
-                                link_text = link.get_text(strip=True)
-                                if link_text:
+                            if full_url not in seen_urls and urlsplit(full_url).netloc == base_domain:
+                                link_text = self._element_text(link)
+                                if link_text and len(link_text) < 200:
                                     chapter_links.append({
                                         'name': link_text,
                                         'url': full_url
                                     })
                                     seen_urls.add(full_url)
 
-            # If still not enough, look for links in unordered lists
-            if len(chapter_links) < 3:
-                for ul in main_content.find_all('ul'):
-                    # Skip if this looks like a navigation menu
-                    if ul.get('class') and any('nav' in c.lower() or 'menu' in c.lower() for c in ul.get('class')):
-                        continue
-
-                    for li in ul.find_all('li'):
-                        link = li.find('a', href=True)
-                        if link:
-                            href = link.get('href', '').strip()
-                            if href and not href.startswith('#'):
-                                full_url = urljoin(base_url, href)
-                                link_domain = urlparse(full_url).netloc
-                                if link_domain == base_domain and full_url not in seen_urls:
-                                    link_text = link.get_text(strip=True)
-                                    if link_text and len(link_text) < 200:
-                                        chapter_links.append({
-                                            'name': link_text,
-                                            'url': full_url
-                                        })
-                                        seen_urls.add(full_url)
-
-        print(f"[Final] Returning {len(chapter_links)} chapter links")
+        logger.debug("[Final] Returning %d chapter links", len(chapter_links))
 
         # Stage 5: Last resort - if still nothing found, try more lenient text filter
         if len(chapter_links) == 0 and len(candidate_links) > 0:
-            print(f"[Stage 5] No links found via strict methods, trying lenient filter on {len(candidate_links)} candidates")
-            # Use a more lenient filter as absolute last resort
-            for link_dict in candidate_links:
-                link_text = link_dict['name']
-                # Accept links with reasonable length as potential chapters
-                if len(link_text) < 150 and len(link_text) > 1:
-                    chapter_links.append(link_dict)
-            print(f"[Stage 5] Lenient filter found {len(chapter_links)} links")
+            logger.debug("[Stage 5] No links found via strict methods, trying lenient filter on %d candidates", len(candidate_links))
+            # Use a more lenient filter as absolute last resort: accept links
+            # with reasonable length as potential chapters
+            chapter_links = [
+                link_dict for link_dict in candidate_links
+                if 1 < len(link_dict['name']) < 150
+            ]
+            logger.debug("[Stage 5] Lenient filter found %d links", len(chapter_links))
 
         return chapter_links
 
+    def _parse_link_document(self, html: str):
+        """
+        Parse HTML into a bare lxml document tree for link scanning.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            Root <html> element, or None if the document is empty
+        """
+        try:
+            try:
+                return lxml.html.document_fromstring(html)
+            except ValueError:
+                # lxml rejects str input that carries an XML encoding declaration
+                return lxml.html.document_fromstring(html.encode('utf-8'), parser=lxml.html.HTMLParser(encoding='utf-8'))
+        except etree.ParserError:
+            return None
+
+    def _element_text(self, element) -> str:
+        """
+        Concatenate an lxml element's stripped text nodes (same as bs4's get_text(strip=True)).
+
+        Args:
+            element: lxml element
+
+        Returns:
+            Element text
+        """
+        return ''.join(text.strip() for text in element.itertext())
+
+    def _first_link(self, element):
+        """
+        Find the first <a href> descendant of an lxml element.
+
+        Args:
+            element: lxml element
+
+        Returns:
+            The link element, or None
+        """
+        for link in element.iterdescendants('a'):
+            if link.get('href') is not None:
+                return link
+        return None
+
     def _tokenize_url(self, url: str) -> List[str]:
         """
         Tokenize a URL into path segments for comparison.
@@ -1003,8 +1455,7 @@ class ContentExtractor:
         Returns:
             List of path segments
         """
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
 
         # Get path and split into segments
         path = parsed.path.strip('/')
@@ -1017,8 +1468,7 @@ class ContentExtractor:
         tokens = []
         for segment in segments:
             # Split by hyphens, underscores, dots
-            parts = segment.replace('-', ' ').replace('_', ' ').replace('.', ' ').split()
-            tokens.extend(parts)
+            tokens.extend(filter(None, URL_TOKEN_SEPARATOR_PATTERN.split(segment)))
 
         return tokens
 
@@ -1033,15 +1483,17 @@ class ContentExtractor:
         Returns:
             Similarity score from 0.0 to 1.0
         """
-        from urllib.parse import urlparse
-
-        parsed1 = urlparse(url1)
-        parsed2 = urlparse(url2)
+        parsed1 = _parse_url(url1)
+        parsed2 = _parse_url(url2)
 
         # URLs must have same domain
         if parsed1.netloc != parsed2.netloc:
             return 0.0
 
+        # Identical paths match on every segment
+        if parsed1.path == parsed2.path:
+            return 1.0
+
         # Get path segments (don't tokenize further for structure comparison)
         path1 = parsed1.path.strip('/').split('/')
         path2 = parsed2.path.strip('/').split('/')
@@ -1063,8 +1515,8 @@ class ContentExtractor:
             else:
                 # Check if segments are similar (differ only in numbers)
                 # Remove all digits and compare
-                seg1_no_digits = ''.join(c for c in seg1 if not c.isdigit())
-                seg2_no_digits = ''.join(c for c in seg2 if not c.isdigit())
+                seg1_no_digits = _strip_digits(seg1)
+                seg2_no_digits = _strip_digits(seg2)
 
                 if seg1_no_digits == seg2_no_digits and seg1_no_digits:
                     # Segments differ only in numbers - consider it a match
@@ -1086,34 +1538,16 @@ class ContentExtractor:
         if len(urls) < 2:
             return None
 
-        from urllib.parse import urlparse
-
         # Get all URL paths
-        paths = [urlparse(u['url']).path.strip('/') for u in urls]
+        paths = [_parse_url(u['url']).path.strip('/') for u in urls]
 
         if not paths:
             return None
 
-        # Find common prefix
-        common_prefix = paths[0]
-        for path in paths[1:]:
-            # Find longest common prefix
-            i = 0
-            while i < len(common_prefix) and i < len(path) and common_prefix[i] == path[i]:
-                i += 1
-            common_prefix = common_prefix[:i]
-
-        # Find common suffix
-        common_suffix = paths[0]
-        for path in paths[1:]:
-            # Find longest common suffix
-            i = -1
-            while abs(i) <= len(common_suffix) and abs(i) <= len(path) and common_suffix[i] == path[i]:
-                i -= 1
-            if i == -1:
-                common_suffix = ""
-            else:
-                common_suffix = common_suffix[i+1:]
+        # Longest common prefix, and the suffix as the prefix of the
+        # reversed paths
+        common_prefix = os.path.commonprefix(paths)
+        common_suffix = os.path.commonprefix([path[::-1] for path in paths])[::-1]
 
         return {
             'prefix': common_prefix,
@@ -1136,36 +1570,71 @@ class ContentExtractor:
         if len(urls) < 2:
             return [urls] if urls else []
 
-        # Build similarity matrix
-        n = len(urls)
-        clusters = []
-        used = set()
+        # Segments score 1 when equal and 0.9 when equal once digits are
+        # removed. Below 1 / (1 - threshold) segments a single unmatched
+        # segment already fails the threshold, so two URLs cluster exactly
+        # when their per-segment keys agree: bucket those in one pass. Deeper
+        # paths keep the pairwise comparison within their (domain, depth).
+        keyed_clusters = {}
+        deep_groups = {}
+        for index, item in enumerate(urls):
+            parsed = _parse_url(item['url'])
+            segments = parsed.path.strip('/').split('/')
+            if threshold <= 0.9 and (len(segments) - 1) / len(segments) < threshold:
+                key = (parsed.netloc, tuple(self._url_segment_key(segment) for segment in segments))
+                keyed_clusters.setdefault(key, (index, []))[1].append(item)
+            else:
+                deep_groups.setdefault((parsed.netloc, len(segments)), []).append(index)
+
+        # (index of first member, members) for every cluster
+        anchored_clusters = list(keyed_clusters.values())
+        for indices in deep_groups.values():
+            # Flags by position within the group
+            count = len(indices)
+            used = [False] * count
+            for a in range(count):
+                if used[a]:
+                    continue
 
-        for i in range(n):
-            if i in used:
-                continue
+                i = indices[a]
+                cluster = [urls[i]]
+                used[a] = True
 
-            cluster = [urls[i]]
-            used.add(i)
+                for b in range(a + 1, count):
+                    if used[b]:
+                        continue
 
-            for j in range(i + 1, n):
-                if j in used:
-                    continue
+                    j = indices[b]
+                    similarity = self._calculate_url_similarity(urls[i]['url'], urls[j]['url'])
 
-                similarity = self._calculate_url_similarity(urls[i]['url'], urls[j]['url'])
+                    if similarity >= threshold:
+                        cluster.append(urls[j])
+                        used[b] = True
 
-                if similarity >= threshold:
-                    cluster.append(urls[j])
-                    used.add(j)
+                anchored_clusters.append((i, cluster))
 
-            if len(cluster) > 1:  # Only keep clusters with 2+ members
-                clusters.append(cluster)
+        # Only keep clusters with 2+ members, in order of first appearance
+        anchored_clusters.sort(key=lambda c: c[0])
+        clusters = [cluster for _, cluster in anchored_clusters if len(cluster) > 1]
 
         # Sort by cluster size (largest first)
         clusters.sort(key=len, reverse=True)
 
         return clusters
 
+    def _url_segment_key(self, segment: str) -> str:
+        """
+        Key under which two path segments count as similar.
+
+        Args:
+            segment: URL path segment
+
+        Returns:
+            The segment without digits, or the segment itself when nothing
+            but digits (which only match exactly) is left
+        """
+        return _strip_digits(segment) or segment
+
     def _detect_sequential_pattern(self, cluster: List[Dict[str, str]]) -> Optional[Dict]:
         """
         Detect if a cluster of URLs contains sequential numbering.
@@ -1176,26 +1645,21 @@ class ContentExtractor:
         Returns:
             Pattern metadata with confidence score, or None
         """
-        import re
-
         if len(cluster) < 2:
             return None
 
-        # Extract numbers from each URL
-        url_numbers = []
+        # Extract numbers from each URL (only their range and distinct count
+        # matter, so they aren't sorted)
+        numbers = []
         for item in cluster:
-            numbers = re.findall(r'\d+', item['url'])
-            if numbers:
+            url_numbers = DIGIT_RUN_PATTERN.findall(item['url'])
+            if url_numbers:
                 # Use the last number found (usually chapter number)
-                url_numbers.append((item, int(numbers[-1])))
+                numbers.append(int(url_numbers[-1]))
 
-        if len(url_numbers) < 2:
+        if len(numbers) < 2:
             return None
 
-        # Sort by number
-        url_numbers.sort(key=lambda x: x[1])
-        numbers = [num for _, num in url_numbers]
-
         # Check for sequence characteristics
         min_num = min(numbers)
         max_num = max(numbers)
@@ -17,6 +17,16 @@ class ScrapeMode(str, Enum):
     HYBRID = "hybrid"
 
 
+# Modes that scrape chapters linked from an index page
+MULTI_PAGE_MODES = frozenset({ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID})
+
+# Modes available in phase 1, and from phase 2 on (in display order)
+PHASE_1_MODES = (ScrapeMode.ONE_PAGE,)
+PHASE_2_MODES = (ScrapeMode.ONE_PAGE, ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID)
+_PHASE_1_MODE_SET = frozenset(PHASE_1_MODES)
+_PHASE_2_MODE_SET = frozenset(PHASE_2_MODES)
+
+
 def is_mode_supported(mode: ScrapeMode, phase: int = 1) -> bool:
     """
     Check if a scraping mode is supported in the given phase.
@@ -28,11 +38,11 @@ def is_mode_supported(mode: ScrapeMode, phase: int = 1) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    if phase >= 1:
-        return mode == ScrapeMode.ONE_PAGE
-
     if phase >= 2:
-        return mode in [ScrapeMode.ONE_PAGE, ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID]
+        return mode in _PHASE_2_MODE_SET
+
+    if phase >= 1:
+        return mode in _PHASE_1_MODE_SET
 
     return False
 
@@ -47,7 +57,4 @@ def get_supported_modes(phase: int = 1) -> list[ScrapeMode]:
     Returns:
         List of supported ScrapeMode values
     """
-    if phase >= 2:
-        return [ScrapeMode.ONE_PAGE, ScrapeMode.INDEX_PAGE, ScrapeMode.HYBRID]
-
-    return [ScrapeMode.ONE_PAGE]
+    return list(PHASE_2_MODES if phase >= 2 else PHASE_1_MODES)
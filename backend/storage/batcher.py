@@ -0,0 +1,150 @@
+"""
+Coalesces concurrent single-chapter writes into batched storage transactions.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from backend.storage.manager import StorageManager
+
+
+class ChapterWriteBatcher:
+    """
+    Queues add-chapter writes and flushes them per book in one transaction.
+
+    Each caller awaits its own result; a single background task drains the
+    queue, waiting at most ``window_seconds`` for more writes to arrive
+    before handing the whole group to ``StorageManager.add_chapters_to_book``.
+    If a group fails, its chapters are retried one by one so that a bad
+    chapter only fails its own request.
+    """
+
+    def __init__(
+        self,
+        storage: StorageManager,
+        max_batch_size: int = 32,
+        window_seconds: float = 0.05
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            storage: Storage manager that performs the writes
+            max_batch_size: Maximum number of chapters flushed together
+            window_seconds: How long to wait for more chapters before flushing
+        """
+        self.storage = storage
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(
+        self,
+        book_id: str,
+        chapter_title: str,
+        chapter_content: str,
+        chapter_index: int
+    ) -> bool:
+        """
+        Queue a chapter write and wait until its batch has been flushed.
+
+        Args:
+            book_id: Existing book ID
+            chapter_title: Chapter title
+            chapter_content: Chapter content
+            chapter_index: Chapter index (0-based)
+
+        Returns:
+            True if the chapter was saved, False otherwise
+        """
+        self._ensure_worker()
+
+        future = self._loop.create_future()
+        chapter = {
+            'title': chapter_title,
+            'content': chapter_content,
+            'index': chapter_index
+        }
+        await self._queue.put((book_id, chapter, future))
+        return await future
+
+    def _ensure_worker(self):
+        """Start the background flush task on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        """Drain the queue forever, flushing one batch at a time."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.window_seconds
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    # Window closed: still take anything that's already queued
+                    try:
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        """
+        Write a batch of queued chapters, one storage transaction per book.
+
+        Args:
+            batch: Queued (book_id, chapter, future) entries
+        """
+        grouped: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        for book_id, chapter, future in batch:
+            grouped.setdefault(book_id, []).append((chapter, future))
+
+        for book_id, items in grouped.items():
+            success = await self._write(book_id, [chapter for chapter, _ in items])
+
+            if success or len(items) == 1:
+                for _, future in items:
+                    if not future.done():
+                        future.set_result(success)
+                continue
+
+            # The group failed: retry each chapter on its own, so only the
+            # requests whose write actually fails report failure
+            for chapter, future in items:
+                success = await self._write(book_id, [chapter])
+                if not future.done():
+                    future.set_result(success)
+
+    async def _write(self, book_id: str, chapters: List[Dict[str, Any]]) -> bool:
+        """
+        Write chapters to a book in one storage transaction.
+
+        Args:
+            book_id: Existing book ID
+            chapters: Chapter dictionaries with 'title', 'content', 'index'
+
+        Returns:
+            True if the chapters were saved, False otherwise
+        """
+        try:
+            return await run_in_threadpool(
+                self.storage.add_chapters_to_book,
+                book_id,
+                chapters
+            )
+        except Exception as e:
+            print(f"Error flushing chapter batch for book {book_id}: {e}")
+            return False
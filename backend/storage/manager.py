@@ -2,13 +2,20 @@
 Storage manager for handling book files and metadata.
 """
 import os
-import json
 import uuid
 import shutil
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Type, TypeVar
 from datetime import datetime
 
+import orjson
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
 from backend.models.schemas import (
     BookMetadata,
     BookIndex,
@@ -18,6 +25,96 @@ from backend.models.schemas import (
 )
 
 
+# Parsed chapter indexes kept in memory (least recently used are evicted)
+INDEX_CACHE_MAX_ENTRIES = 512
+
+# (mtime_ns, size, inode) of a file; changes whenever the file is rewritten
+StatSignature = Tuple[int, int, int]
+
+# Deleted books are moved here and removed in the background
+TRASH_DIR_NAME = ".trash"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Runs the tree removals for deleted books off the request path
+_trash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="book-trash")
+
+
+def _read_model(model: Type[ModelT], path: Path) -> ModelT:
+    """
+    Load and validate a JSON file into a model.
+
+    orjson parsing followed by Python-mode validation is faster here than
+    model_validate_json, notably for long chapter lists.
+
+    Args:
+        model: Model class
+        path: JSON file path
+
+    Returns:
+        Validated model instance
+    """
+    return model.model_validate(orjson.loads(path.read_bytes()))
+
+
+def _stat_signature(path) -> Optional[StatSignature]:
+    """
+    Get the (mtime_ns, size, inode) signature of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Signature tuple, or None if the file cannot be stat()ed
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _write_bytes(path: str, data: bytes):
+    """
+    Write bytes to a file given as a plain string path.
+
+    Chapter writes join their paths with os.path.join on a precomputed
+    directory string, which skips building a Path object per file.
+
+    Args:
+        path: File path
+        data: File contents
+    """
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _tree_size(path: str) -> int:
+    """
+    Total size of the files below a directory.
+
+    Walks with os.scandir, whose entries carry their file type, so only files
+    are stat()ed. Like Path.rglob, symlinked directories are not descended
+    into, while symlinked files count with their target's size.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Size in bytes
+    """
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+
 class StorageManager:
     """Manages book storage on the file system."""
 
@@ -31,6 +128,129 @@ class StorageManager:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Deleted books waiting for removal (dot-prefixed, so never listed)
+        self.trash_dir = self.data_dir / TRASH_DIR_NAME
+        self.trash_dir.mkdir(exist_ok=True)
+        self._empty_trash()
+
+        # Serializes read-modify-write updates of index.json/metadata.json
+        self._write_lock = threading.Lock()
+
+        # In-memory copy of every book's metadata, kept current by the write paths
+        # and reconciled with the data directory whenever its mtime changes
+        self._books: Dict[str, BookMetadata] = {}
+        self._books_lock = threading.Lock()
+        self._data_dir_mtime_ns: Optional[int] = None
+        self._load_book_index()
+
+        # Parsed index.json per book with the file's (mtime, size, inode) when
+        # read, so edits made outside the write paths are noticed too
+        self._index_cache: "OrderedDict[str, Tuple[StatSignature, List[ChapterInfo]]]" = OrderedDict()
+
+    def _load_book_index(self):
+        """
+        Scan the data directory and reconcile the in-memory metadata with it.
+
+        Books whose directory appeared since the last scan are loaded and books
+        whose directory is gone are dropped, which picks up books copied in by
+        hand or written by another worker process.
+        """
+        # Taken before scanning, so changes made during the scan trigger another
+        mtime_ns = os.stat(self.data_dir).st_mtime_ns
+
+        with self._books_lock:
+            known = set(self._books)
+
+        found = set()
+        loaded: Dict[str, BookMetadata] = {}
+        complete = True
+
+        # scandir entries carry their file type, so no stat per book directory
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+
+                found.add(entry.name)
+                if entry.name in known:
+                    continue
+
+                metadata = self._read_metadata(entry.name)
+                if metadata:
+                    loaded[entry.name] = metadata
+                else:
+                    # Possibly still being written; look again on the next call
+                    complete = False
+
+        with self._books_lock:
+            for book_id in known - found:
+                self._books.pop(book_id, None)
+            for book_id, metadata in loaded.items():
+                # Metadata saved by this process meanwhile is newer
+                self._books.setdefault(book_id, metadata)
+            self._data_dir_mtime_ns = mtime_ns if complete else None
+
+    def _refresh_book_index(self):
+        """Rescan the data directory if books were added or removed since the last scan."""
+        try:
+            mtime_ns = os.stat(self.data_dir).st_mtime_ns
+        except OSError:
+            return
+
+        if mtime_ns != self._data_dir_mtime_ns:
+            self._load_book_index()
+
+    def _empty_trash(self):
+        """Remove books left in the trash by a previous run, in the background."""
+        with os.scandir(self.trash_dir) as entries:
+            for entry in entries:
+                _trash_executor.submit(shutil.rmtree, entry.path, ignore_errors=True)
+
+    def _remember_book(self, metadata: BookMetadata):
+        """Record a book's latest metadata in the in-memory index."""
+        with self._books_lock:
+            self._books[metadata.id] = metadata
+        self._touch_book(metadata.id)
+
+    def _touch_book(self, book_id: str):
+        """Drop a book's cached index after its files changed."""
+        with self._books_lock:
+            self._index_cache.pop(book_id, None)
+
+    def chapter_signature(
+        self,
+        book_id: str,
+        chapter_id: int
+    ) -> Optional[Tuple[StatSignature, StatSignature]]:
+        """
+        Get a value that changes whenever a chapter's content response would.
+
+        Built from the stat signatures of index.json and of the chapter file,
+        so writes made by other worker processes or by hand are noticed too.
+
+        Args:
+            book_id: Book ID
+            chapter_id: Chapter ID
+
+        Returns:
+            (index signature, chapter file signature), or None if not found
+        """
+        loaded = self._load_chapters(book_id)
+        if loaded is None:
+            return None
+
+        index_signature, chapters = loaded
+        if not chapters or chapter_id >= len(chapters):
+            return None
+
+        chapter_signature = _stat_signature(
+            self._get_chapters_dir(book_id) / chapters[chapter_id]['file']
+        )
+        if chapter_signature is None:
+            return None
+
+        return (index_signature, chapter_signature)
+
     def _get_book_path(self, book_id: str) -> Path:
         """Get the directory path for a specific book."""
         return self.data_dir / book_id
@@ -105,10 +325,11 @@ class StorageManager:
 
         # Save metadata
         metadata_path = self._get_metadata_path(book_id)
-        metadata_path.write_text(
-            metadata.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            metadata_path,
+            metadata.model_dump_json(indent=2)
         )
+        self._remember_book(metadata)
 
         # Create index
         chapter_info = ChapterInfo(
@@ -120,9 +341,9 @@ class StorageManager:
 
         # Save index
         index_path = self._get_index_path(book_id)
-        index_path.write_text(
-            book_index.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            index_path,
+            book_index.model_dump_json(indent=2)
         )
 
         return book_id
@@ -154,28 +375,122 @@ class StorageManager:
         Returns:
             book_id: The generated book ID
         """
-        # Generate unique book ID
+        book_id = self._create_book_dirs()
+        chapters_dir = os.fspath(self._get_chapters_dir(book_id))
+
+        # Save each chapter
+        chapter_infos = [
+            self._write_chapter_file(chapters_dir, idx, chapter)
+            for idx, chapter in enumerate(chapters)
+        ]
+
+        self._write_book_records(
+            book_id, title, chapter_infos, source_url,
+            author, language, tags, description, scrape_mode
+        )
+
+        return book_id
+
+    async def save_multi_chapter_book_async(
+        self,
+        title: str,
+        chapters: List[Dict[str, str]],  # [{'title': '...', 'content': '...', 'url': '...'}]
+        source_url: str,
+        author: Optional[str] = None,
+        language: str = "en",
+        tags: Optional[List[str]] = None,
+        description: Optional[str] = None,
+        scrape_mode: str = "index_page"
+    ) -> str:
+        """
+        Save a book with multiple chapters without blocking the event loop.
+        Chapter files are written concurrently on worker threads, then the
+        metadata and index are written once.
+
+        Args:
+            title: Book title
+            chapters: List of chapter dictionaries with 'title', 'content', 'url'
+            source_url: Original source URL (index page)
+            author: Author name
+            language: Language code
+            tags: List of tags
+            description: Book description
+            scrape_mode: Scraping mode used (index_page or hybrid)
+
+        Returns:
+            book_id: The generated book ID
+        """
+        book_id = await run_in_threadpool(self._create_book_dirs)
+        chapters_dir = os.fspath(self._get_chapters_dir(book_id))
+
+        # Save chapters in parallel (each goes to its own new file)
+        chapter_infos = await asyncio.gather(*(
+            run_in_threadpool(self._write_chapter_file, chapters_dir, idx, chapter)
+            for idx, chapter in enumerate(chapters)
+        ))
+
+        await run_in_threadpool(
+            self._write_book_records,
+            book_id, title, list(chapter_infos), source_url,
+            author, language, tags, description, scrape_mode
+        )
+
+        return book_id
+
+    def _create_book_dirs(self) -> str:
+        """
+        Generate a new book ID and create its directories.
+
+        Returns:
+            book_id: The generated book ID
+        """
         book_id = str(uuid.uuid4())
-        book_path = self._get_book_path(book_id)
-        chapters_dir = self._get_chapters_dir(book_id)
+        self._get_chapters_dir(book_id).mkdir(parents=True, exist_ok=True)
+        return book_id
 
-        # Create directories
-        book_path.mkdir(parents=True, exist_ok=True)
-        chapters_dir.mkdir(parents=True, exist_ok=True)
+    def _write_chapter_file(self, chapters_dir: str, idx: int, chapter: Dict[str, str]) -> ChapterInfo:
+        """
+        Write one chapter of a new book.
 
-        # Save each chapter
-        chapter_infos = []
-        for idx, chapter in enumerate(chapters):
-            chapter_file = f"{idx:03d}.md"
-            chapter_path = chapters_dir / chapter_file
-            chapter_path.write_text(chapter['content'], encoding="utf-8")
-
-            chapter_infos.append(ChapterInfo(
-                id=idx,
-                title=chapter['title'],
-                file=chapter_file
-            ))
+        Args:
+            chapters_dir: Book's chapters directory
+            idx: Chapter index (0-based)
+            chapter: Chapter dictionary with 'title' and 'content'
+
+        Returns:
+            Index entry for the chapter
+        """
+        chapter_file = f"{idx:03d}.md"
+        # Encode up front and write bytes, skipping the text I/O layer
+        _write_bytes(
+            os.path.join(chapters_dir, chapter_file),
+            chapter['content'].encode("utf-8")
+        )
+
+        return ChapterInfo(
+            id=idx,
+            title=chapter['title'],
+            file=chapter_file
+        )
+
+    def _write_book_records(
+        self,
+        book_id: str,
+        title: str,
+        chapter_infos: List[ChapterInfo],
+        source_url: str,
+        author: Optional[str],
+        language: str,
+        tags: Optional[List[str]],
+        description: Optional[str],
+        scrape_mode: str
+    ):
+        """
+        Write metadata.json and index.json for a newly saved book.
 
+        Each file is written to a temporary path and swapped in with
+        os.replace, so readers never see a partially written file.
+        """
         # Create metadata
         metadata = BookMetadata(
             id=book_id,
@@ -184,7 +499,7 @@ class StorageManager:
             language=language,
             encoding="utf-8",
             created_at=datetime.utcnow(),
-            chapters_count=len(chapters),
+            chapters_count=len(chapter_infos),
             tags=tags or [],
             source_url=source_url,
             scrape_mode=scrape_mode,
@@ -192,21 +507,24 @@ class StorageManager:
         )
 
         # Save metadata
-        metadata_path = self._get_metadata_path(book_id)
-        metadata_path.write_text(
-            metadata.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            self._get_metadata_path(book_id),
+            metadata.model_dump_json(indent=2)
         )
+        self._remember_book(metadata)
 
         # Create and save index
         book_index = BookIndex(chapters=chapter_infos)
-        index_path = self._get_index_path(book_id)
-        index_path.write_text(
-            book_index.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            self._get_index_path(book_id),
+            book_index.model_dump_json(indent=2)
         )
 
-        return book_id
+    def _replace_file(self, path: Path, text: str):
+        """Atomically replace a file's contents with text."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(text.encode("utf-8"))
+        os.replace(tmp_path, path)
 
     def get_book(self, book_id: str) -> Optional[BookMetadata]:
         """
@@ -218,15 +536,33 @@ class StorageManager:
         Returns:
             BookMetadata or None if not found
         """
-        metadata_path = self._get_metadata_path(book_id)
+        metadata = self._books.get(book_id)
+        if metadata is not None:
+            return metadata
 
-        if not metadata_path.exists():
-            return None
+        # Not indexed (e.g. copied into the data directory while running)
+        metadata = self._read_metadata(book_id)
+        if metadata:
+            self._remember_book(metadata)
+        return metadata
+
+    def _read_metadata(self, book_id: str) -> Optional[BookMetadata]:
+        """
+        Load book metadata from disk.
+
+        Args:
+            book_id: Book ID
+
+        Returns:
+            BookMetadata or None if not found
+        """
+        metadata_path = self._get_metadata_path(book_id)
 
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return BookMetadata(**data)
+            return _read_model(BookMetadata, metadata_path)
+        except (FileNotFoundError, NotADirectoryError):
+            # Missing book (read directly rather than probing with exists())
+            return None
         except Exception as e:
             print(f"Error loading metadata for book {book_id}: {e}")
             return None
@@ -239,22 +575,76 @@ class StorageManager:
             book_id: Book ID
 
         Returns:
-            List of ChapterInfo or None if not found
+            List of ChapterInfo or None if not found (shared with the index
+            cache, so callers must not modify it)
+        """
+        loaded = self._load_chapters(book_id)
+        return loaded[1] if loaded is not None else None
+
+    def _load_chapters(
+        self,
+        book_id: str
+    ) -> Optional[Tuple[StatSignature, List[ChapterInfo]]]:
+        """
+        Get a book's chapter list together with the index.json signature.
+
+        Args:
+            book_id: Book ID
+
+        Returns:
+            (index signature, chapters) or None if not found
         """
         index_path = self._get_index_path(book_id)
 
-        if not index_path.exists():
+        signature = _stat_signature(index_path)
+        if signature is None:
             return None
 
+        # Served from memory while index.json is unchanged
+        with self._books_lock:
+            cached = self._index_cache.get(book_id)
+            if cached is not None and cached[0] == signature:
+                self._index_cache.move_to_end(book_id)
+                return cached
+
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                book_index = BookIndex(**data)
-                return book_index.chapters
+            book_index = _read_model(BookIndex, index_path)
         except Exception as e:
             print(f"Error loading index for book {book_id}: {e}")
             return None
 
+        loaded = (signature, book_index.chapters)
+        with self._books_lock:
+            self._index_cache[book_id] = loaded
+            self._index_cache.move_to_end(book_id)
+            while len(self._index_cache) > INDEX_CACHE_MAX_ENTRIES:
+                self._index_cache.popitem(last=False)
+
+        return loaded
+
+    def get_chapter_file(self, book_id: str, chapter_id: int) -> Optional[Path]:
+        """
+        Get the markdown file backing a chapter.
+
+        Args:
+            book_id: Book ID
+            chapter_id: Chapter ID
+
+        Returns:
+            Path to the chapter file, or None if not found
+        """
+        chapters = self.get_chapters(book_id)
+
+        if not chapters or chapter_id >= len(chapters):
+            return None
+
+        chapter_path = self._get_chapters_dir(book_id) / chapters[chapter_id]['file']
+
+        if not chapter_path.exists():
+            return None
+
+        return chapter_path
+
     def get_chapter_content(
         self,
         book_id: str,
@@ -276,7 +666,7 @@ class StorageManager:
             return None
 
         chapter_info = chapters[chapter_id]
-        chapter_path = self._get_chapters_dir(book_id) / chapter_info.file
+        chapter_path = self._get_chapters_dir(book_id) / chapter_info['file']
 
         if not chapter_path.exists():
             return None
@@ -288,9 +678,10 @@ class StorageManager:
             next_chapter = chapter_id + 1 if chapter_id < len(chapters) - 1 else None
             previous_chapter = chapter_id - 1 if chapter_id > 0 else None
 
-            return ChapterContent(
+            # Every field comes from the validated index or the file itself
+            return ChapterContent.model_construct(
                 chapter_id=chapter_id,
-                title=chapter_info.title,
+                title=chapter_info['title'],
                 content=content,
                 next_chapter=next_chapter,
                 previous_chapter=previous_chapter
@@ -306,28 +697,24 @@ class StorageManager:
         Returns:
             List of BookListItem
         """
-        books = []
-
-        if not self.data_dir.exists():
-            return books
-
-        for book_dir in self.data_dir.iterdir():
-            if not book_dir.is_dir() or book_dir.name.startswith('.'):
-                continue
-
-            metadata = self.get_book(book_dir.name)
-            if metadata:
-                books.append(
-                    BookListItem(
-                        id=metadata.id,
-                        title=metadata.title,
-                        author=metadata.author,
-                        language=metadata.language,
-                        chapters_count=metadata.chapters_count,
-                        created_at=metadata.created_at,
-                        tags=metadata.tags
-                    )
-                )
+        self._refresh_book_index()
+
+        with self._books_lock:
+            indexed = list(self._books.values())
+
+        # Built from already-validated metadata, so skip re-validation
+        books = [
+            BookListItem.model_construct(
+                id=metadata.id,
+                title=metadata.title,
+                author=metadata.author,
+                language=metadata.language,
+                chapters_count=metadata.chapters_count,
+                created_at=metadata.created_at,
+                tags=metadata.tags
+            )
+            for metadata in indexed
+        ]
 
         # Sort by created_at descending (newest first)
         books.sort(key=lambda x: x.created_at, reverse=True)
@@ -338,6 +725,9 @@ class StorageManager:
         """
         Delete a book and all its files.
 
+        The book directory is renamed into the trash, which is atomic and
+        immediate; its files are removed afterwards on a background thread.
+
         Args:
             book_id: Book ID
 
@@ -350,7 +740,12 @@ class StorageManager:
             return False
 
         try:
-            shutil.rmtree(book_path)
+            trash_path = self.trash_dir / f"{book_id}-{uuid.uuid4().hex}"
+            os.rename(book_path, trash_path)
+            _trash_executor.submit(shutil.rmtree, trash_path, ignore_errors=True)
+            with self._books_lock:
+                self._books.pop(book_id, None)
+            self._touch_book(book_id)
             return True
         except Exception as e:
             print(f"Error deleting book {book_id}: {e}")
@@ -420,17 +815,18 @@ class StorageManager:
 
         # Save metadata
         metadata_path = self._get_metadata_path(book_id)
-        metadata_path.write_text(
-            metadata.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            metadata_path,
+            metadata.model_dump_json(indent=2)
         )
+        self._remember_book(metadata)
 
         # Create empty index
         book_index = BookIndex(chapters=[])
         index_path = self._get_index_path(book_id)
-        index_path.write_text(
-            book_index.model_dump_json(indent=2),
-            encoding="utf-8"
+        self._replace_file(
+            index_path,
+            book_index.model_dump_json(indent=2)
         )
 
         return book_id
@@ -455,55 +851,88 @@ class StorageManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.book_exists(book_id):
-            return False
+        return self.add_chapters_to_book(book_id, [{
+            'title': chapter_title,
+            'content': chapter_content,
+            'index': chapter_index
+        }])
 
-        try:
-            # Save chapter file
-            chapter_file = f"{chapter_index:03d}.md"
-            chapter_path = self._get_chapters_dir(book_id) / chapter_file
-            chapter_path.write_text(chapter_content, encoding="utf-8")
-
-            # Update index
-            index_path = self._get_index_path(book_id)
-            with open(index_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                book_index = BookIndex(**data)
-
-            # Add new chapter info
-            new_chapter = ChapterInfo(
-                id=chapter_index,
-                title=chapter_title,
-                file=chapter_file
-            )
-            book_index.chapters.append(new_chapter)
+    def add_chapters_to_book(
+        self,
+        book_id: str,
+        chapters: List[Dict[str, Any]]  # [{'title': '...', 'content': '...', 'index': 0}]
+    ) -> bool:
+        """
+        Add several chapters to an existing book in one transaction.
+        Reads the index and metadata first, then writes every chapter file and
+        rewrites the index and metadata once.
 
-            # Sort chapters by id to maintain order
-            book_index.chapters.sort(key=lambda ch: ch.id)
+        Args:
+            book_id: Existing book ID
+            chapters: List of chapter dictionaries with 'title', 'content', 'index'
 
-            # Save updated index
-            index_path.write_text(
-                book_index.model_dump_json(indent=2),
-                encoding="utf-8"
-            )
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.book_exists(book_id):
+            return False
 
-            # Update metadata chapter count
-            metadata_path = self._get_metadata_path(book_id)
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata_data = json.load(f)
-                metadata = BookMetadata(**metadata_data)
+        try:
+            with self._write_lock:
+                # Load the index and metadata before touching any file, so an
+                # unreadable book fails without leaving unindexed chapters behind
+                index_path = self._get_index_path(book_id)
+                book_index = _read_model(BookIndex, index_path)
+                metadata_path = self._get_metadata_path(book_id)
+                metadata = _read_model(BookMetadata, metadata_path)
+
+                # Prepare every chapter (bad input raises here, before any write)
+                chapters_dir = os.fspath(self._get_chapters_dir(book_id))
+                new_chapters = []
+                chapter_files = []
+                for chapter in chapters:
+                    chapter_file = f"{chapter['index']:03d}.md"
+                    chapter_files.append((
+                        os.path.join(chapters_dir, chapter_file),
+                        chapter['content'].encode("utf-8")
+                    ))
+                    new_chapters.append(ChapterInfo(
+                        id=chapter['index'],
+                        title=chapter['title'],
+                        file=chapter_file
+                    ))
+
+                # Save chapter files
+                for chapter_path, data in chapter_files:
+                    _write_bytes(chapter_path, data)
+
+                # Update index
+                book_index.chapters.extend(new_chapters)
+
+                # Sort chapters by id to maintain order
+                book_index.chapters.sort(key=lambda ch: ch['id'])
+
+                # Save updated index
+                self._replace_file(
+                    index_path,
+                    book_index.model_dump_json(indent=2)
+                )
 
-            metadata.chapters_count = len(book_index.chapters)
+                # Update metadata chapter count
+                metadata.chapters_count = len(book_index.chapters)
 
-            metadata_path.write_text(
-                metadata.model_dump_json(indent=2),
-                encoding="utf-8"
-            )
+                self._replace_file(
+                    metadata_path,
+                    metadata.model_dump_json(indent=2)
+                )
+                self._remember_book(metadata)
 
             return True
 
         except Exception as e:
-            print(f"Error adding chapter to book {book_id}: {e}")
+            # Only an I/O error while writing can leave chapter files changed
+            self._touch_book(book_id)
+            print(f"Error adding chapters to book {book_id}: {e}")
             return False
 
     def get_storage_stats(self) -> Dict[str, Any]:
@@ -517,13 +946,12 @@ class StorageManager:
         total_size = 0
 
         if self.data_dir.exists():
-            for book_dir in self.data_dir.iterdir():
-                if book_dir.is_dir() and not book_dir.name.startswith('.'):
-                    total_books += 1
-                    # Calculate directory size
-                    for file_path in book_dir.rglob('*'):
-                        if file_path.is_file():
-                            total_size += file_path.stat().st_size
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not entry.name.startswith('.'):
+                        total_books += 1
+                        # Calculate directory size
+                        total_size += _tree_size(entry.path)
 
         return {
             "total_books": total_books,
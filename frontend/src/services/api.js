@@ -74,6 +74,21 @@ export default {
         simplify_markdown: simplifyMarkdown
       })
     },
+    async previewWithFullContent(url, mode = 'one_page', selectedContainers = null, chineseMode = false, simplifyMarkdown = false) {
+      // Keep the preview JSON small and stream the full content separately
+      const response = await this.previewWithContainers(url, mode, false, selectedContainers, chineseMode, simplifyMarkdown)
+      if (response.data.success && response.data.content_token) {
+        const content = await this.previewContent(response.data.content_token)
+        response.data.full_content = content.data
+      }
+      return response
+    },
+    previewContent(contentToken) {
+      return api.get(`/api/scraper/preview/${contentToken}/content`, {
+        responseType: 'text',
+        transformResponse: (data) => data
+      })
+    },
     execute(url, mode = 'one_page', metadataOverrides = null, customContent = null, selectedChapters = null, chineseMode = false, simplifyMarkdown = false) {
       return api.post('/api/scraper/execute', {
         url,
@@ -107,6 +122,13 @@ export default {
         chinese_mode: chineseMode,
         simplify_markdown: simplifyMarkdown
       })
+    },
+    addChapters(bookId, chapters) {
+      // chapters: [{ chapter_url, chapter_index, chapter_name, custom_content, selected_containers, chinese_mode, simplify_markdown }]
+      return api.post('/api/scraper/add-chapters', {
+        book_id: bookId,
+        chapters
+      })
     }
   },
 